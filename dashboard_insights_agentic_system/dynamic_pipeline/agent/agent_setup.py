@@ -6,6 +6,8 @@ with explicit reasoning and action steps.
 
 from typing import List, Dict, Any
 from urllib import response
+import orjson
+import pandas as pd
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain_core.tools import BaseTool
 from langchain.chat_models import ChatOpenAI  # Or your chosen LLM
@@ -13,6 +15,15 @@ from .tools import dashboard_tools
 from langchain.prompts import ChatPromptTemplate
 from utils.data_cleaning import DataCleaner
 
+
+def _json_default(obj: Any) -> Any:
+    """
+    Fallback for values orjson can't serialize natively, e.g. the DataFrames produced by DataCleaner.
+    """
+    if isinstance(obj, pd.DataFrame):
+        return obj.to_dict(orient="records")
+    return str(obj)
+
 class DashboardAgentFactory:
     """
     Factory for creating and running a dashboard-interacting agent
@@ -88,11 +99,17 @@ class DashboardAgentFactory:
             ("system", "You are an expert BI analyst. Understand and analyze the following cleaned dashboard data:"),
             ("human", "{dashboard_data}")
         ])
-        formatted_prompt = prompt.format_messages(dashboard_data=str(dashboard_data))
+        # Compact JSON is cheaper to build than str(dict) and uses fewer prompt tokens
+        payload = orjson.dumps(
+            dashboard_data,
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode()
+        formatted_prompt = prompt.format_messages(dashboard_data=payload)
         summary = self.llm(formatted_prompt)
         return summary.content if hasattr(summary, "content") else summary
 
-    def act_on_dashboard(self, user_query: str, dashboard_state_summary: str) -> str:
+    async def act_on_dashboard(self, user_query: str, dashboard_state_summary: str) -> str:
         """
     Action step: run the user query via the agent using the
     dashboard tools, informed by the reasoning summary.
@@ -112,7 +129,8 @@ class DashboardAgentFactory:
         "user_query": user_query,
         "dashboard_data": dashboard_state_summary
     }
-        response = actions.invoke(agent_input)
+        # Dashboard tools are async, so independent tool calls can run concurrently
+        response = await actions.ainvoke(agent_input)
     # Extract the content if the response is an object with 'content'
         if hasattr(response, "content"):
             return response.content
@@ -120,12 +138,14 @@ class DashboardAgentFactory:
             return response["output"]
         return str(response)
 
-    def run(self, user_query: str, raw_dashboard_data: Dict[str, Any]) -> str:
+    async def run(self, user_query: str, raw_dashboard_data: Dict[str, Any]) -> str:
         """
         Full pipeline:
         1. Reason about the dashboard data.
         2. Act on the dashboard to fulfill the user's query.
 
+        A coroutine, like act_on_dashboard: await it, or call asyncio.run(agent.run(...)) from sync code.
+
         Args:
             user_query: User's natural language question or goal.
             raw_dashboard_data: Original dashboard data from DataCleaner.
@@ -134,6 +154,6 @@ class DashboardAgentFactory:
             Final agent response.
         """
         dashboard_summary = self.reason_over_dashboard(raw_dashboard_data)
-        return self.act_on_dashboard(user_query, dashboard_summary)
+        return await self.act_on_dashboard(user_query, dashboard_summary)
 
         
\ No newline at end of file
@@ -3,8 +3,18 @@ dashboard_client.py
 Unified client for interacting with BI dashboards (Power BI, Tableau, etc.)
 """
 
+import logging
 from typing import Optional, Dict, Any
-import requests
+import httpx
+
+try:
+    # HTTP/2 needs the optional h2 package (httpx[http2]); without it the client speaks HTTP/1.1
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
 class DashboardClient:
     def __init__(self, base_url: str, api_key: str, source: str):
@@ -23,100 +33,120 @@ class DashboardClient:
         if self.source not in ("powerbi", "tableau"):
             raise ValueError(f"Unsupported source: {self.source}")
 
+        # One pooled async client so concurrent agent tool calls share TCP/TLS connections
+        transport = httpx.AsyncHTTPTransport(
+            http2=_HTTP2_AVAILABLE,
+            retries=2,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        )
+        self.client = httpx.AsyncClient(headers=self.headers, timeout=10.0, transport=transport)
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP client and its pooled connections.
+        """
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "DashboardClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
     # ---------------------------
     # Core dashboard actions
     # ---------------------------
-    def get_dashboard_state(self) -> dict:
+    async def get_dashboard_state(self) -> dict:
         endpoint = f"{self.base_url}/{self.source}/latest_dashboard_data"
-        resp = requests.get(endpoint, headers=self.headers)
+        resp = await self.client.get(endpoint)
         resp.raise_for_status()
         return resp.json()
 
 
-    def apply_filter(self, component_name: str, filter_criteria: Dict[str, Any]) -> bool:
+    async def apply_filter(self, component_name: str, filter_criteria: Dict[str, Any]) -> bool:
         """
         Apply a filter to a component in the dashboard using backend API.
         """
         endpoint = f"{self.base_url}/{self.source}/apply_filter"
-        resp = requests.post(endpoint, json={"component": component_name, "filters": filter_criteria}, headers=self.headers)
+        resp = await self.client.post(endpoint, json={"component": component_name, "filters": filter_criteria})
         if resp.status_code != 200:
-            print(f"[ERROR] Failed to apply filter: {resp.text}")
+            logger.error("Failed to apply filter: %s", resp.text)
             return False
-        print(f"[DEBUG] Applied filter on {component_name} with {filter_criteria}")
+        logger.debug("Applied filter on %s with %s", component_name, filter_criteria)
         return True
 
-    def apply_slicer(self, slicer_name: str, value: Any) -> bool:
+    async def apply_slicer(self, slicer_name: str, value: Any) -> bool:
         """
         Set a slicer value using backend API.
         """
         endpoint = f"{self.base_url}/{self.source}/apply_slicer"
-        resp = requests.post(endpoint, json={"slicer": slicer_name, "value": value}, headers=self.headers)
+        resp = await self.client.post(endpoint, json={"slicer": slicer_name, "value": value})
         if resp.status_code != 200:
-            print(f"[ERROR] Failed to set slicer: {resp.text}")
+            logger.error("Failed to set slicer: %s", resp.text)
             return False
-        print(f"[DEBUG] Set slicer {slicer_name} to {value}")
+        logger.debug("Set slicer %s to %s", slicer_name, value)
         return True
 
-    def drill_down(self, visual_name: str, hierarchy_level: str) -> bool:
+    async def drill_down(self, visual_name: str, hierarchy_level: str) -> bool:
         """
         Drill down into a visual hierarchy using backend API.
         """
         endpoint = f"{self.base_url}/{self.source}/drill_down"
-        resp = requests.post(endpoint, json={"visual": visual_name, "level": hierarchy_level}, headers=self.headers)
+        resp = await self.client.post(endpoint, json={"visual": visual_name, "level": hierarchy_level})
         if resp.status_code != 200:
-            print(f"[ERROR] Failed to drill down: {resp.text}")
+            logger.error("Failed to drill down: %s", resp.text)
             return False
-        print(f"[DEBUG] Drilled down {visual_name} to level {hierarchy_level}")
+        logger.debug("Drilled down %s to level %s", visual_name, hierarchy_level)
         return True
 
-    def drill_up(self, visual_name: str) -> bool:
+    async def drill_up(self, visual_name: str) -> bool:
         """
         Drill up one level in a visual hierarchy using backend API.
         """
         endpoint = f"{self.base_url}/{self.source}/drill_up"
-        resp = requests.post(endpoint, json={"visual": visual_name}, headers=self.headers)
+        resp = await self.client.post(endpoint, json={"visual": visual_name})
         if resp.status_code != 200:
-            print(f"[ERROR] Failed to drill up: {resp.text}")
+            logger.error("Failed to drill up: %s", resp.text)
             return False
-        print(f"[DEBUG] Drilled up {visual_name}")
+        logger.debug("Drilled up %s", visual_name)
         return True
 
-    def highlight_data_point(self, visual_name: str, element_id: str) -> bool:
+    async def highlight_data_point(self, visual_name: str, element_id: str) -> bool:
         """
         Highlight a data point in a visual using backend API.
         """
         endpoint = f"{self.base_url}/{self.source}/highlight_data_point"
-        resp = requests.post(endpoint, json={"visual": visual_name, "element_id": element_id}, headers=self.headers)
+        resp = await self.client.post(endpoint, json={"visual": visual_name, "element_id": element_id})
         if resp.status_code != 200:
-            print(f"[ERROR] Failed to highlight data point: {resp.text}")
+            logger.error("Failed to highlight data point: %s", resp.text)
             return False
-        print(f"[DEBUG] Highlighted {element_id} in {visual_name}")
+        logger.debug("Highlighted %s in %s", element_id, visual_name)
         return True
 
-    def clear_filter(self, component_name: Optional[str] = None) -> bool:
+    async def clear_filter(self, component_name: Optional[str] = None) -> bool:
         """
         Clear filter(s) for a component or all components using backend API.
         """
         endpoint = f"{self.base_url}/{self.source}/clear_filter"
         payload = {"component": component_name} if component_name else {}
-        resp = requests.post(endpoint, json=payload, headers=self.headers)
+        resp = await self.client.post(endpoint, json=payload)
         if resp.status_code != 200:
-            print(f"[ERROR] Failed to clear filter(s): {resp.text}")
+            logger.error("Failed to clear filter(s): %s", resp.text)
             return False
         target = component_name if component_name else "ALL components"
-        print(f"[DEBUG] Cleared filters for {target}")
+        logger.debug("Cleared filters for %s", target)
         return True
 
-    def refresh_dashboard_data(self) -> bool:
+    async def refresh_dashboard_data(self) -> bool:
         """
         Refresh dashboard data from the source using backend API.
         """
         endpoint = f"{self.base_url}/{self.source}/refresh_dashboard_data"
-        resp = requests.post(endpoint, headers=self.headers)
+        resp = await self.client.post(endpoint)
         if resp.status_code != 200:
-            print(f"[ERROR] Failed to refresh dashboard data: {resp.text}")
+            logger.error("Failed to refresh dashboard data: %s", resp.text)
             return False
-        print(f"[DEBUG] Refreshed data for {self.source} dashboard")
+        logger.debug("Refreshed data for %s dashboard", self.source)
         return True
 
     # ---------------------------
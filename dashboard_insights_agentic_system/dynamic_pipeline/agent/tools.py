@@ -22,60 +22,60 @@ def set_dashboard_client(client: DashboardClient):
 
 
 @tool("apply_filter")
-def apply_filter(component_name: str, filter_criteria: Dict[str, Any]) -> str:
+async def apply_filter(component_name: str, filter_criteria: Dict[str, Any]) -> str:
     if not _dashboard_client:
         return "No dashboard client initialized."
-    success = _dashboard_client.apply_filter(component_name, filter_criteria)
+    success = await _dashboard_client.apply_filter(component_name, filter_criteria)
     return f"Filter applied to {component_name}: {filter_criteria}" if success else "Failed to apply filter."
 
 
 @tool("set_slicer_value")
-def set_slicer_value(slicer_name: str, value: Any) -> str:
+async def set_slicer_value(slicer_name: str, value: Any) -> str:
     if not _dashboard_client:
         return "No dashboard client initialized."
-    success = _dashboard_client.apply_slicer(slicer_name, value)
+    success = await _dashboard_client.apply_slicer(slicer_name, value)
     return f"Slicer '{slicer_name}' set to {value}" if success else f"Failed to set slicer '{slicer_name}'."
 
 
 @tool("drill_down_visual")
-def drill_down_visual(visual_name: str, hierarchy_level: str) -> str:
+async def drill_down_visual(visual_name: str, hierarchy_level: str) -> str:
     if not _dashboard_client:
         return "No dashboard client initialized."
-    success = _dashboard_client.drill_down(visual_name, hierarchy_level)
+    success = await _dashboard_client.drill_down(visual_name, hierarchy_level)
     return f"Drilled down on '{visual_name}' to {hierarchy_level}" if success else f"Failed to drill down on '{visual_name}'."
 
 
 @tool("drill_up_visual")
-def drill_up_visual(visual_name: str) -> str:
+async def drill_up_visual(visual_name: str) -> str:
     if not _dashboard_client:
         return "No dashboard client initialized."
-    success = _dashboard_client.drill_up(visual_name)
+    success = await _dashboard_client.drill_up(visual_name)
     return f"Drilled up on '{visual_name}'" if success else f"Failed to drill up on '{visual_name}'."
 
 
 @tool("highlight_visual_element")
-def highlight_visual_element(visual_name: str, element_id: str) -> str:
+async def highlight_visual_element(visual_name: str, element_id: str) -> str:
     if not _dashboard_client:
         return "No dashboard client initialized."
-    success = _dashboard_client.highlight_data_point(visual_name, element_id)
+    success = await _dashboard_client.highlight_data_point(visual_name, element_id)
     return f"Highlighted element '{element_id}' in '{visual_name}'" if success else f"Failed to highlight element '{element_id}'."
 
 
 @tool("reset_filters")
-def reset_filters(component_name: Optional[str] = None) -> str:
+async def reset_filters(component_name: Optional[str] = None) -> str:
     if not _dashboard_client:
         return "No dashboard client initialized."
-    success = _dashboard_client.clear_filter(component_name)
+    success = await _dashboard_client.clear_filter(component_name)
     if success:
         return f"Filters reset for '{component_name}'" if component_name else "All filters reset"
     return f"Failed to reset filters for '{component_name}'" if component_name else "Failed to reset all filters."
 
 
 @tool("refresh_data")
-def refresh_data() -> str:
+async def refresh_data() -> str:
     if not _dashboard_client:
         return "No dashboard client initialized."
-    success = _dashboard_client.refresh_dashboard_data()
+    success = await _dashboard_client.refresh_dashboard_data()
     return "Dashboard data refreshed" if success else "Failed to refresh dashboard data"
 
 dashboard_tools = [
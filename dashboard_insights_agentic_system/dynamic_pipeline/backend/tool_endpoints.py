@@ -1,18 +1,72 @@
-from fastapi import FastAPI, requests
+import asyncio
+import copy
+from fastapi import Body, FastAPI, requests
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any, Optional, List
+from cachetools import TTLCache
 from extractors.dashboard_extractor import DashboardExtractor
 
-app = FastAPI()
+# orjson serializes the large nested dashboard payloads much faster than stdlib json
+app = FastAPI(default_response_class=ORJSONResponse)
+# Full dashboard payloads are large and highly compressible; skip tiny status responses
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 extractor = DashboardExtractor()
 
+# Short-lived snapshots of the current dashboard state, keyed by extraction arguments.
+# Mutating endpoints read from here and only pay for the extraction that applies the change.
+_snapshot_cache = TTLCache(maxsize=64, ttl=5)
+
+# Dashboard collections whose entries endpoints look up by "name"
+_INDEXED_COLLECTIONS = ("filters", "slicers", "visuals", "components")
+
+
+def _index(dashboard: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Adds "_<collection>_by_name" lookups so endpoints find entries in O(1) instead of scanning.
+    The first entry with a given name wins, matching the previous linear scans.
+    """
+    for key in _INDEXED_COLLECTIONS:
+        entries = dashboard.get(key) or []
+        if isinstance(entries, dict):
+            entries = entries.values()
+        by_name = {}
+        for entry in entries:
+            if isinstance(entry, dict) and entry.get("name") is not None:
+                by_name.setdefault(entry["name"], entry)
+        dashboard[f"_{key}_by_name"] = by_name
+    return dashboard
+
+
+async def _get_snapshot(source: str, auth_type: str, **kwargs) -> Dict[str, Any]:
+    """
+    Returns a private copy of the current dashboard state, reusing a recent extraction if possible.
+    The cache is only touched from the event loop; extraction itself runs in a worker thread.
+    """
+    try:
+        key = (source, auth_type, frozenset(kwargs.items()))
+    except TypeError:
+        # Unhashable extraction parameters, skip caching
+        return _index(await asyncio.to_thread(extractor.extract_dashboard, source=source, auth_type=auth_type, **kwargs))
+
+    dashboard = _snapshot_cache.get(key)
+    if dashboard is None:
+        dashboard = await asyncio.to_thread(extractor.extract_dashboard, source=source, auth_type=auth_type, **kwargs)
+        _index(dashboard)
+        if dashboard.get("status") == "success":
+            _snapshot_cache[key] = dashboard
+    # Callers mutate the snapshot, so never hand out the cached object itself
+    # (deepcopy keeps the by-name indexes pointing at the copied entries)
+    return copy.deepcopy(dashboard)
+
 @app.get("/public_dashboard_state")
 async def get_public_dashboard_state(source: str, auth_type: str = "public", **kwargs) -> Dict[str, Any]:
     """
     Returns the current state of the dashboard for Power BI or Tableau.
     """
     # You may need to pass additional connection/extraction parameters via kwargs
-    dashboard_data = extractor.extract_dashboard(source=source, auth_type=auth_type, **kwargs)
+    dashboard_data = await asyncio.to_thread(extractor.extract_dashboard, source=source, auth_type=auth_type, **kwargs)
     return dashboard_data
 
 @app.get("/private_dashboard_state")
@@ -21,7 +75,7 @@ async def get_private_dashboard_state(source: str, auth_type: str = "private", *
     Returns the current state of the dashboard for Power BI or Tableau using private API.
     """
     # may need to pass additional connection/extraction parameters via kwargs
-    dashboard_data = extractor.extract_dashboard(source=source, auth_type=auth_type, **kwargs)
+    dashboard_data = await asyncio.to_thread(extractor.extract_dashboard, source=source, auth_type=auth_type, **kwargs)
     return dashboard_data
 
 @app.post("/apply_filter")
@@ -35,28 +89,25 @@ async def apply_filter(
     """
     Apply a filter to a component in the dashboard.
     """
-    dashboard = extractor.extract_dashboard(source=source, auth_type=auth_type, **kwargs)
+    dashboard = await _get_snapshot(source=source, auth_type=auth_type, **kwargs)
         # components to filter tables, Charts/visuals, KPIs, slicers, and Cards
     filters = dashboard.get("filters", [])
-    filter_found = False
-     # Update the selected value for the filter
-    for f in filters:
-        if f.get("name") == component_name:
-            f["selected"] = filter_value
-            filter_found = True
-            break
-
-    if not filter_found:
+    target = dashboard["_filters_by_name"].get(component_name)
+    if target is None:
         return {"status": "failed", "error": f"Filter {component_name} not found."}
+     # Update the selected value for the filter
+    target["selected"] = filter_value
+    active_filters = {f["name"]: f["selected"] for f in filters if f.get("selected")}
     # updating the dashboard with the new filter value
     dashboard["filters"] = filters
 
     # Trigger re-extraction with new filter values
     # (Assuming your extractor supports passing filters)
-    dashboard = extractor.extract_dashboard(
+    dashboard = await asyncio.to_thread(
+    extractor.extract_dashboard,
     source=source,
     auth_type=auth_type,
-    filters={f["name"]: f.get("selected") for f in filters if f.get("selected")},
+    filters=active_filters,
     **kwargs
 )
     dashboard["filters"] = filters
@@ -73,23 +124,23 @@ async def apply_slicer(
     """
     Set a slicer value in the dashboard.
     """
-    dashboard = extractor.extract_dashboard(source=source, auth_type=auth_type, **kwargs)
+    dashboard = await _get_snapshot(source=source, auth_type=auth_type, **kwargs)
     slicers = dashboard.get("slicers", [])
     
     # Find and update the slicer
-    for slicer in slicers:
-        if slicer.get("name") == slicer_name:
-            slicer["selected"] = value
-            break
-    else:
+    slicer = dashboard["_slicers_by_name"].get(slicer_name)
+    if slicer is None:
         return {"status": "failed", "error": f"Slicer {slicer_name} not found."}
+    slicer["selected"] = value
+    active_slicers = {s["name"]: s["selected"] for s in slicers if s.get("selected")}
     # Update the dashboard with the new slicer value
     dashboard["slicers"] = slicers
     # Trigger re-extraction with new slicer values
-    dashboard = extractor.extract_dashboard(
+    dashboard = await asyncio.to_thread(
+        extractor.extract_dashboard,
         source=source,
         auth_type=auth_type,
-        slicers={s["name"]: s.get("selected") for s in slicers if s.get("selected")},
+        slicers=active_slicers,
         **kwargs
     )
     
@@ -106,22 +157,18 @@ async def drill_down(
     """
     Drill down into a visual hierarchy.
     """
-    dashboard = extractor.extract_dashboard(source=source, auth_type=auth_type, **kwargs)
+    dashboard = await _get_snapshot(source=source, auth_type=auth_type, **kwargs)
     visuals = dashboard.get("visuals", {})
     
     
-    for visual in visuals.values():
-        if visual.get("name") == visual_name:
-            if "drill_state" not in visual:
-                visual["drill_state"] = []
-            visual["drill_state"].append(level)
-            break
-    else:
+    visual = dashboard["_visuals_by_name"].get(visual_name)
+    if visual is None:
         return {"status": "failed", "error": f"Visual {visual_name} not found."}
+    visual.setdefault("drill_state", []).append(level)
     # Update the dashboard with the new drill state
     dashboard["visuals"] = visuals
     # Trigger re-extraction with new drill state
-    dashboard = extractor.extract_dashboard(source=source, auth_type=auth_type, drill_state={visual_name: visual["drill_state"]}, **kwargs)
+    dashboard = await asyncio.to_thread(extractor.extract_dashboard, source=source, auth_type=auth_type, drill_state={visual_name: visual["drill_state"]}, **kwargs)
     return {"status": "success", "dashboard": dashboard}
 
 @app.post("/drill_up")
@@ -134,21 +181,17 @@ async def drill_up(
     """
     Drill up one level in a visual hierarchy.
     """
-    dashboard = extractor.extract_dashboard(source=source, auth_type=auth_type, **kwargs)
+    dashboard = await _get_snapshot(source=source, auth_type=auth_type, **kwargs)
     visuals = dashboard.get("visuals", {})
     
-    for visual in visuals.values():
-        if visual.get("name") == visual_name:
-            if "drill_state" not in visual:
-                visual["drill_state"] = []
-            visual["drill_state"].pop() # Remove last level
-            break
-    else:
+    visual = dashboard["_visuals_by_name"].get(visual_name)
+    if visual is None:
         return {"status": "failed", "error": f"Visual {visual_name} not found."}
+    visual.setdefault("drill_state", []).pop() # Remove last level
             # Update the dashboard with the new drill state
     dashboard["visuals"] = visuals
     # Trigger re-extraction with new drill state
-    dashboard = extractor.extract_dashboard(source=source, auth_type=auth_type, drill_state={visual_name: visual["drill_state"]}, **kwargs)
+    dashboard = await asyncio.to_thread(extractor.extract_dashboard, source=source, auth_type=auth_type, drill_state={visual_name: visual["drill_state"]}, **kwargs)
     return {"status": "success", "dashboard": dashboard}
 
 @app.post('/highlight_data')
@@ -162,25 +205,24 @@ async def highlight_data(
     """
     Highlight a specific data point in a visual or table.
     """
-    dashboard = extractor.extract_dashboard(source=source, auth_type=auth_type, **kwargs)
+    dashboard = await _get_snapshot(source=source, auth_type=auth_type, **kwargs)
     components = dashboard.get("components", [])
     
-    for comp in components:
-        if comp.get("name") == component_name:
-            if "highlights" not in comp:
-                comp["highlights"] = []
-            comp["highlights"].append(data_point)
-            break
-    else:
+    target = dashboard["_components_by_name"].get(component_name)
+    if target is None:
         return {"status": "failed", "error": f"Component {component_name} not found."}
+    # Extractors share an immutable () placeholder, so build a new list rather than appending
+    target["highlights"] = [*target.get("highlights", ()), data_point]
+    active_highlights = {comp["name"]: comp["highlights"] for comp in components if comp.get("highlights")}
     
     # Update the dashboard with the new highlights
     dashboard["components"] = components
     # Trigger re-extraction with new highlights
-    dashboard = extractor.extract_dashboard(
+    dashboard = await asyncio.to_thread(
+        extractor.extract_dashboard,
         source=source,
         auth_type=auth_type,
-        highlights={comp["name"]: comp.get("highlights") for comp in components if comp.get("highlights")},
+        highlights=active_highlights,
         **kwargs
     )
 
@@ -196,23 +238,23 @@ async def clear_filter(
     """
     Clear all filters applied to a specific component.
     """
-    dashboard = extractor.extract_dashboard(source=source, auth_type=auth_type, **kwargs)
+    dashboard = await _get_snapshot(source=source, auth_type=auth_type, **kwargs)
     components = dashboard.get("components", [])
 
-    for comp in components:
-        if comp.get("name") == component_name:
-            comp["filters"] = []
-            break
-    else:
+    target = dashboard["_components_by_name"].get(component_name)
+    if target is None:
         return {"status": "failed", "error": f"Component {component_name} not found."}
+    target["filters"] = []
+    active_filters = {comp["name"]: comp["filters"] for comp in components if comp.get("filters")}
 
     # Update the dashboard with the cleared filters
     dashboard["components"] = components
     # Trigger re-extraction with cleared filters
-    dashboard = extractor.extract_dashboard(
+    dashboard = await asyncio.to_thread(
+        extractor.extract_dashboard,
         source=source,
         auth_type=auth_type,
-        filters={comp["name"]: comp.get("filters") for comp in components if comp.get("filters")},
+        filters=active_filters,
         **kwargs
     )
 
@@ -222,16 +264,21 @@ async def clear_filter(
 async def refresh_dashboard(
     source: str,
     auth_type: str = "public",  # <-- Add this
+    prev_state: Optional[Dict[str, Any]] = Body(None),
     **kwargs
 ) -> Dict[str, Any]:
     """
     Refresh the entire dashboard.
+
+    If the client sends the dashboard it already holds as prev_state, the current
+    filters/drill state/highlights are read from it instead of re-extracting.
     """
-    dashboard = extractor.extract_dashboard(source=source, auth_type=auth_type, **kwargs)
+    dashboard = prev_state if prev_state is not None else await _get_snapshot(source=source, auth_type=auth_type, **kwargs)
     current_filters = {f["name"]: f.get("selected") for f in dashboard.get("filters", []) if f.get("selected")}
     current_drill_state = dashboard.get("drill_state", {})
     current_highlights = {comp["name"]: comp.get("highlights") for comp in dashboard.get("components", []) if comp.get("highlights")}
-    dashboard = extractor.extract_dashboard(
+    dashboard = await asyncio.to_thread(
+    extractor.extract_dashboard,
     source=source,
     auth_type=auth_type,
     filters=current_filters if current_filters else None,
@@ -242,3 +289,11 @@ async def refresh_dashboard(
 
     return {"status": "success", "dashboard": dashboard}
     
+
+
+if __name__ == "__main__":
+    import os
+    import uvicorn
+
+    # uvloop + httptools replace the stock asyncio loop and HTTP parser; one worker per core
+    uvicorn.run("tool_endpoints:app", loop="uvloop", http="httptools", workers=os.cpu_count())
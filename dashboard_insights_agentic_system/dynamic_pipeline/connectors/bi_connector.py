@@ -1,13 +1,16 @@
-import re
 # bi_connector.py
+import functools
 import logging
 from typing import Dict, Any, Optional
 
-from powerbi_connector import connect_private_powerbi, connect_public_powerbi
-from tableau_connector import connect_private_tableau, connect_public_tableau
-
 logger = logging.getLogger(__name__)
 
+# Connector functions, imported on first use so msal / tableauserverclient are only
+# loaded for the BI tool actually being connected to
+_PBI_PRIV = _PBI_PUB = None
+_TAB_PRIV = _TAB_PUB = None
+
+
 def connect_bi_dashboard(
     url: str = None,
     source: Optional[str] = None,
@@ -41,6 +44,7 @@ def connect_bi_dashboard(
         # Add url to kwargs for connector
         kwargs['url'] = url
         if source == "powerbi":
+            connect_private_powerbi, connect_public_powerbi = _powerbi_connectors()
             if auth_type == "private":
                 result = connect_private_powerbi(**kwargs)
                 return _normalize_result(result, source, auth_type)
@@ -51,6 +55,7 @@ def connect_bi_dashboard(
                 raise ValueError(f"Unsupported auth_type '{auth_type}' for Power BI")
 
         elif source == "tableau":
+            connect_private_tableau, connect_public_tableau = _tableau_connectors()
             if auth_type == "private":
                 result = connect_private_tableau(**kwargs)
                 return _normalize_result(result, source, auth_type)
@@ -76,6 +81,22 @@ def connect_bi_dashboard(
         }
 
 
+def _powerbi_connectors():
+    global _PBI_PRIV, _PBI_PUB
+    if _PBI_PRIV is None:
+        from powerbi_connector import connect_private_powerbi, connect_public_powerbi
+        _PBI_PRIV, _PBI_PUB = connect_private_powerbi, connect_public_powerbi
+    return _PBI_PRIV, _PBI_PUB
+
+
+def _tableau_connectors():
+    global _TAB_PRIV, _TAB_PUB
+    if _TAB_PRIV is None:
+        from tableau_connector import connect_private_tableau, connect_public_tableau
+        _TAB_PRIV, _TAB_PUB = connect_private_tableau, connect_public_tableau
+    return _TAB_PRIV, _TAB_PUB
+
+
 def _normalize_result(result: Dict[str, Any], source: str, auth_type: str) -> Dict[str, Any]:
     """
     Normalize connector-specific return dict into a consistent schema for the agent.
@@ -123,11 +144,23 @@ def detect_bi_source_from_url(url: str) -> str:
     """
     if not url:
         raise ValueError("No URL provided for BI source detection.")
+    source = _detect_bi_source(url)
+    if source is None:
+        raise ValueError(f"Could not detect BI source from URL: {url.lower()}")
+    return source
+
+
+@functools.lru_cache(maxsize=1024)
+def _detect_bi_source(url: str) -> Optional[str]:
+    """
+    Memoized detection; returns None for unknown URLs so the caller raises and nothing
+    exception-related is cached. The same URL is re-detected across retries and drill states.
+    """
     url = url.lower()
-    # Power BI patterns
-    if "powerbi.com" in url or re.search(r"/powerbi/|/reports/", url):
+    # Plain substring checks; domains first since they are the common case.
+    # Power BI patterns are all tried before Tableau ones, so a URL matching both is Power BI.
+    if "powerbi.com" in url or "/powerbi/" in url or "/reports/" in url:
         return "powerbi"
-    # Tableau patterns
-    if "tableau.com" in url or re.search(r"/tableau/|/views/", url):
+    if "tableau.com" in url or "/tableau/" in url or "/views/" in url:
         return "tableau"
-    raise ValueError(f"Could not detect BI source from URL: {url}")
\ No newline at end of file
+    return None
@@ -1,14 +1,42 @@
 # powerbi_connector.py
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from typing import Dict, Any, Optional, List, Tuple
 
+import aiohttp
 import requests
 import msal  # Microsoft Authentication Library for Python
 
+from utils.http_utils import build_http_session
+
 # configure logger
 logger = logging.getLogger(__name__)
 
 
+_HTTP = build_http_session()
+
+# One MSAL app per credential set, so its in-memory token cache survives across calls
+_msal_apps: Dict[Tuple[str, str, str], msal.ConfidentialClientApplication] = {}
+_msal_apps_lock = threading.Lock()
+
+
+def _get_msal_app(tenant_id: str, client_id: str, client_secret: str) -> msal.ConfidentialClientApplication:
+    """
+    Return the cached ConfidentialClientApplication for these credentials, creating it on first use.
+    The secret is keyed by its hash so it isn't held as a dict key.
+    """
+    key = (tenant_id, client_id, hashlib.sha256(client_secret.encode()).hexdigest())
+    with _msal_apps_lock:
+        app = _msal_apps.get(key)
+        if app is None:
+            authority = f"https://login.microsoftonline.com/{tenant_id}"
+            app = msal.ConfidentialClientApplication(client_id, authority=authority, client_credential=client_secret)
+            _msal_apps[key] = app
+    return app
+
+
 def get_access_token_client_credentials(
     tenant_id: str,
     client_id: str,
@@ -28,10 +56,10 @@ def get_access_token_client_credentials(
         Dict with keys: {"access_token": str, "expires_in": int, "token_type": "Bearer"} or {"error": ...}
     """
     scope = scope or ["https://analysis.windows.net/powerbi/api/.default"]
-    authority = f"https://login.microsoftonline.com/{tenant_id}"
 
-    app = msal.ConfidentialClientApplication(client_id, authority=authority, client_credential=client_secret)
-    result = app.acquire_token_for_client(scopes=scope)
+    # Reusing the app skips authority discovery; a still-valid token comes from its cache
+    app = _get_msal_app(tenant_id, client_id, client_secret)
+    result = app.acquire_token_silent(scope, account=None) or app.acquire_token_for_client(scopes=scope)
 
     if "access_token" in result:
         return {
@@ -68,12 +96,12 @@ def connect_private_powerbi(
         return {"status": "failed", "error": token_resp}
 
     access_token = token_resp["access_token"]
-    session = requests.Session()
+    # Same pooled, retrying adapter as public fetches; the caller keeps this session for all REST calls
+    session = build_http_session()
     session.headers.update(
         {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
-            "User-Agent": "DashboardInsightsAgenticSystem/1.0",
         }
     )
 
@@ -98,9 +126,23 @@ def connect_public_powerbi(embed_url: str) -> Dict[str, Any]:
         dict: {"status":"success","source":"powerbi","content": "<html...>"} or failed dict
     """
     try:
-        resp = requests.get(embed_url, timeout=10)
+        resp = _HTTP.get(embed_url, timeout=10)
         resp.raise_for_status()
         return {"status": "success", "source": "powerbi", "content": resp.text}
     except requests.RequestException as e:
         logger.exception("Failed to fetch public Power BI URL: %s", e)
-        return {"status": "failed", "error": str(e)}
\ No newline at end of file
+        return {"status": "failed", "error": str(e)}
+
+
+async def connect_public_powerbi_async(embed_url: str, session: aiohttp.ClientSession) -> Dict[str, Any]:
+    """
+    Async counterpart of connect_public_powerbi; the caller owns the aiohttp session so
+    several embeds can be fetched concurrently over one connection pool.
+    """
+    try:
+        async with session.get(embed_url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            resp.raise_for_status()
+            return {"status": "success", "source": "powerbi", "content": await resp.text()}
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.exception("Failed to fetch public Power BI URL: %s", e)
+        return {"status": "failed", "error": str(e)}
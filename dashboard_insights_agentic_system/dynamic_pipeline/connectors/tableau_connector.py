@@ -1,12 +1,19 @@
+import asyncio
 import logging
 from typing import Dict, Any, Optional
 
+import aiohttp
 import requests
 import tableauserverclient as TSC
 
+from utils.http_utils import build_http_session
+
 logger = logging.getLogger(__name__)
 
 
+_HTTP = build_http_session()
+
+
 def connect_private_tableau(
     server_url: str,
     pat_name: str,
@@ -54,7 +61,7 @@ def connect_public_tableau(public_url: str) -> Dict[str, Any]:
         dict with raw HTML or failure.
     """
     try:
-        resp = requests.get(public_url, timeout=10)
+        resp = _HTTP.get(public_url, timeout=10)
         resp.raise_for_status()
         return {"status": "success", "source": "tableau", "content": resp.text}
     except requests.RequestException as e:
@@ -62,6 +69,19 @@ def connect_public_tableau(public_url: str) -> Dict[str, Any]:
         return {"status": "failed", "error": str(e)}
 
 
+async def connect_public_tableau_async(public_url: str, session: aiohttp.ClientSession) -> Dict[str, Any]:
+    """
+    Async version of connect_public_tableau that fetches through a caller-provided aiohttp session.
+    """
+    try:
+        async with session.get(public_url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            resp.raise_for_status()
+            return {"status": "success", "source": "tableau", "content": await resp.text()}
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.exception("Failed to fetch public Tableau URL: %s", e)
+        return {"status": "failed", "error": str(e)}
+
+
 def tableau_sign_out(server: TSC.Server) -> None:
     """
     Sign-out helper for Tableau server sessions. Call this when you are done with the server.
@@ -1,13 +1,63 @@
 # powerbi_extractor.py
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 
-from bs4 import BeautifulSoup
+import ijson
+import lxml.html
+import orjson
 
 from ocr_helper import OCRHelper
 
 logger = logging.getLogger(__name__)
 
+# Shared initial "highlights" value for every component; an immutable tuple rather than a
+# fresh list per component. Whoever adds a highlight replaces it with a new list.
+_NO_HIGHLIGHTS = ()
+
+# Top-level keys of the report payload that extract_private_dashboard keeps
+_REPORT_KEYS = frozenset({"tables", "kpis", "filters", "visuals", "layout"})
+
+# Substrings whose presence means a public page has DOM content worth parsing
+_CONTENT_TAG_MARKERS = ("<table", "<select", "<input", "<img", "<svg")
+
+# Number of OCR results kept per extractor, keyed by a hash of the page they were taken from
+_OCR_CACHE_SIZE = 64
+
+# Report payloads kept per extractor with their ETag, for conditional re-fetches; stored as orjson
+# bytes so each hit decodes a fresh copy (callers mutate the result) in C rather than deep-copying
+_REPORT_CACHE_SIZE = 64
+
+# Tags collected by the single document walk in extract_public_dashboard
+_COLLECTED_TAGS = ("table", "select", "input", "img", "svg", "section", "div")
+
+
+def _text(el) -> str:
+    """
+    Stripped text content of an lxml element.
+    """
+    return el.text_content().strip()
+
+
+def _table_cells(table) -> tuple:
+    """
+    Headers (every <th>) and rows (the <td>/<th> texts of every <tr> after the first) of an lxml
+    <table>, as literal cell text.
+    """
+    headers = [_text(th) for th in table.iter("th")]
+    rows = [[_text(cell) for cell in tr.iter("td", "th")] for tr in list(table.iter("tr"))[1:]]
+    return headers, rows
+
+
+def _class_tuple(el) -> Optional[tuple]:
+    """
+    The element's classes as a tuple (hashable, so layout entries can be deduplicated), or None.
+    """
+    cls = el.get("class")
+    return tuple(cls.split()) if cls else None
+
 
 class PowerBIExtractor:
     """
@@ -20,6 +70,66 @@ class PowerBIExtractor:
         :param ocr_helper: Optional shared OCRHelper instance.
         """
         self.ocr = ocr_helper or OCRHelper()
+        self._ocr_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._ocr_cache_lock = threading.Lock()
+        self._report_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._report_cache_lock = threading.Lock()
+
+    def _cached_ocr(self, embed_url: str, html_content: str) -> Dict[str, Any]:
+        """
+        OCR the dashboard at embed_url, reusing the last result while the fetched page is byte-identical
+        (agent re-planning and drill iterations re-extract unchanged dashboards). Only successes are cached.
+        """
+        key = (embed_url, hashlib.blake2b(html_content.encode(), digest_size=16).digest())
+        with self._ocr_cache_lock:
+            cached = self._ocr_cache.get(key)
+            if cached is not None:
+                self._ocr_cache.move_to_end(key)
+                return cached
+
+        result = self.ocr.extract_from_url(embed_url)
+        if result.get("status") == "success":
+            with self._ocr_cache_lock:
+                self._ocr_cache[key] = result
+                self._ocr_cache.move_to_end(key)
+                if len(self._ocr_cache) > _OCR_CACHE_SIZE:
+                    self._ocr_cache.popitem(last=False)
+        return result
+
+    def _fetch_report(self, client, url: str) -> Dict[str, Any]:
+        """
+        GET a report payload, revalidating a previously seen one with If-None-Match.
+        A 304 decodes the cached payload bytes instead of streaming and filtering the report again.
+        """
+        with self._report_cache_lock:
+            cached = self._report_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        # Stream the payload (it can run to several MB) and keep only the top-level keys used
+        # by extract_private_dashboard, instead of buffering the body and materializing the whole JSON tree
+        with client.get(url, stream=True, headers=headers) as resp:
+            if resp.status_code == 304 and cached:
+                with self._report_cache_lock:
+                    if url in self._report_cache:
+                        self._report_cache.move_to_end(url)
+                return orjson.loads(cached[1])
+            resp.raise_for_status()
+            resp.raw.decode_content = True
+            data = {
+                key: value
+                for key, value in ijson.kvitems(resp.raw, "", use_float=True)
+                if key in _REPORT_KEYS
+            }
+            etag = resp.headers.get("ETag")
+
+        if etag:
+            payload = orjson.dumps(data)
+            with self._report_cache_lock:
+                self._report_cache[url] = (etag, payload)
+                self._report_cache.move_to_end(url)
+                if len(self._report_cache) > _REPORT_CACHE_SIZE:
+                    self._report_cache.popitem(last=False)
+        return data
 
     def extract_private_dashboard(self, client, workspace_id: str, report_id: str, drill_state: Optional[dict] = None) -> Dict[str, Any]:
         """
@@ -27,9 +137,7 @@ class PowerBIExtractor:
         """
         try:
             url = f"https://api.powerbi.com/v1.0/myorg/groups/{workspace_id}/reports/{report_id}"
-            resp = client.get(url)
-            resp.raise_for_status()
-            data = resp.json()
+            data = self._fetch_report(client, url)
 
             # Example breakdown (customize as needed for your API response)
             tables = data.get("tables", {})
@@ -37,30 +145,35 @@ class PowerBIExtractor:
             filters = data.get("filters", {})
             visuals = data.get("visuals", {})
             layout = data.get("layout", {})
-            components = {}
             # Build a components dict for agent reasoning
-            for table_name, table in tables.items():
-                components[table_name] = {
+            components = {
+                table_name: {
                     "type": "table",
                     "fields": table.get("fields", []),
                     "rows": table.get("rows", []),
-                    "highlights": []
+                    "highlights": _NO_HIGHLIGHTS
                 }
-            for kpi in kpis:
-                components[kpi.get("name", f"kpi_{len(components)+1}")] = {
+                for table_name, table in tables.items()
+            }
+            components.update({
+                kpi.get("name") or f"kpi_{i}": {
                     "type": "kpi",
                     "value": kpi.get("value"),
                     "description": kpi.get("description", ""),
-                    "highlights": []
+                    "highlights": _NO_HIGHLIGHTS
                 }
-            for visual_name, visual in visuals.items():
-                components[visual_name] = {
+                for i, kpi in enumerate(kpis, 1)
+            })
+            components.update({
+                visual_name: {
                     "type": "visual",
                     "visual_type": visual.get("type"),
                     "fields": visual.get("fields", []),
                     "metadata": visual.get("metadata", {}),
-                    "highlights": []
+                    "highlights": _NO_HIGHLIGHTS
                 }
+                for visual_name, visual in visuals.items()
+            })
 
             return {
                 "status": "success",
@@ -88,125 +201,127 @@ class PowerBIExtractor:
                 "error": str(e)
             }
 
-    def extract_public_dashboard(self, embed_url: str, use_ocr: bool = True, drill_state: Optional[dict] = None) -> Dict[str, Any]:
+    def extract_public_dashboard(self, embed_url: str, use_ocr: bool = True, drill_state: Optional[dict] = None,
+                                 html_content: Optional[str] = None) -> Dict[str, Any]:
         """
         Extracts and structures public Power BI dashboard content for agent reasoning.
+        Pass html_content to parse an already-fetched page instead of fetching embed_url.
         """
         try:
-            from bi_connector import connect_public_powerbi
-            conn = connect_public_powerbi(embed_url)
-            if conn["status"] != "success":
-                return {
-                    "status": "failed",
-                    "tables": {},
-                    "kpis": [],
-                    "filters": {},
-                    "visuals": {},
-                    "layout": {},
-                    "components": {},
-                    "drill_state": drill_state or {},
-                    "error": conn.get("error")
-                }
+            if html_content is None:
+                from powerbi_connector import connect_public_powerbi
+                conn = connect_public_powerbi(embed_url)
+                if conn["status"] != "success":
+                    return {
+                        "status": "failed",
+                        "tables": {},
+                        "kpis": [],
+                        "filters": {},
+                        "visuals": {},
+                        "layout": {},
+                        "components": {},
+                        "drill_state": drill_state or {},
+                        "error": conn.get("error")
+                    }
+                html_content = conn["content"]
 
-            html_content = conn["content"]
-            soup = BeautifulSoup(html_content, "html.parser")
+            # Publish-to-web pages are usually an iframe wrapper with none of the tags parsed below;
+            # a substring scan spots that and skips building a DOM (only OCR yields data then)
+            lowered = html_content.lower()
+            has_content_tags = any(marker in lowered for marker in _CONTENT_TAG_MARKERS)
 
+            # Walk the document once, bucketing the elements each section below needs.
+            # Buckets keep document order, so results match per-tag searches.
+            nodes = {tag: [] for tag in _COLLECTED_TAGS}
+            layout_nodes = []
+            if has_content_tags:
+                # lxml parses and queries in C; much faster than bs4's html.parser on large pages
+                tree = lxml.html.document_fromstring(html_content)
+                for el in tree.iter(*_COLLECTED_TAGS):
+                    nodes[el.tag].append(el)
+                    if el.tag in ("section", "div"):
+                        layout_nodes.append(el)
 
-            tables = {}
-            kpis = []
-            filters = {}
-            visuals = {}
-            layout = {}
-            components = {}
+            # Each section is built by comprehensions and merged into components once at the end,
+            # so every dict is sized in one go instead of growing entry by entry.
+            # Merge order (tables, KPIs, filters, visuals) matches the previous insertion order.
 
             # --- Parse tables from HTML ---
-            for table in soup.find_all("table"):
-                headers = [th.get_text(strip=True) for th in table.find_all("th")]
-                rows = []
-                for tr in table.find_all("tr")[1:]:
-                    cells = tr.find_all(["td", "th"])
-                    row = [cell.get_text(strip=True) for cell in cells]
-                    rows.append(row)
-                table_name = f"table_{len(tables)+1}"
-                tables[table_name] = {"headers": headers, "rows": rows}
-                components[table_name] = {
-                    "type": "table",
-                    "fields": headers,
-                    "rows": rows,
-                    "highlights": []
-                }
+            # headers/rows lists are shared by tables[...] and components[...], not copied
+            parsed_tables = [
+                (f"table_{idx}", *_table_cells(table))
+                for idx, table in enumerate(nodes["table"], 1)
+            ]
+            tables = {name: {"headers": headers, "rows": rows} for name, headers, rows in parsed_tables}
+            table_components = {
+                name: {"type": "table", "fields": headers, "rows": rows, "highlights": _NO_HIGHLIGHTS}
+                for name, headers, rows in parsed_tables
+            }
 
             # --- Parse KPIs from HTML or OCR ---
+            kpis = []
+            kpi_components = {}
             if use_ocr:
-                ocr_result = self.ocr.extract_from_url(embed_url)
+                ocr_result = self._cached_ocr(embed_url, html_content)
                 if ocr_result["status"] == "success":
-                    for idx, num in enumerate(ocr_result["numbers"]):
-                        kpi_name = f"kpi_{idx+1}"
-                        kpis.append({"name": kpi_name, "value": num})
-                        components[kpi_name] = {"type": "kpi", "value": num, "highlights": []}
+                    kpis = [{"name": f"kpi_{idx}", "value": num} for idx, num in enumerate(ocr_result["numbers"], 1)]
+                    kpi_components = {
+                        kpi["name"]: {"type": "kpi", "value": kpi["value"], "highlights": _NO_HIGHLIGHTS} for kpi in kpis
+                    }
                 else:
-                    components["ocr_error"] = {"type": "error", "message": ocr_result["error"], "highlights": []}
+                    kpi_components = {"ocr_error": {"type": "error", "message": ocr_result["error"], "highlights": _NO_HIGHLIGHTS}}
 
             # --- Parse filters (dropdowns, inputs) ---
-            filter_idx = 1
-            for select in soup.find_all("select"):
-                options = [opt.get_text(strip=True) for opt in select.find_all("option")]
-                filter_name = select.get("name") or f"filter_{filter_idx}"
-                filters[filter_name] = options
-                components[filter_name] = {
-                    "type": "filter",
-                    "options": options,
-                    "highlights": []
-                }
-                filter_idx += 1
-            for inp in soup.find_all("input"):
-                filter_name = inp.get("name") or f"filter_{filter_idx}"
-                value = inp.get("value")
-                filters[filter_name] = value
-                components[filter_name] = {
-                    "type": inp.get("type", "input"),
-                    "value": value,
-                    "highlights": []
-                }
-                filter_idx += 1
+            # Unnamed selects are numbered first, then unnamed inputs continue the count
+            parsed_selects = [
+                # text() hands back strings directly, without building an element proxy per option
+                (select.get("name") or f"filter_{idx}", [t.strip() for t in select.xpath(".//option/text()")])
+                for idx, select in enumerate(nodes["select"], 1)
+            ]
+            parsed_inputs = [
+                (inp.get("name") or f"filter_{idx}", inp.get("type", "input"), inp.get("value"))
+                for idx, inp in enumerate(nodes["input"], len(parsed_selects) + 1)
+            ]
+            filters = {
+                **{name: options for name, options in parsed_selects},
+                **{name: value for name, _, value in parsed_inputs},
+            }
+            filter_components = {
+                **{name: {"type": "filter", "options": options, "highlights": _NO_HIGHLIGHTS} for name, options in parsed_selects},
+                **{name: {"type": input_type, "value": value, "highlights": _NO_HIGHLIGHTS} for name, input_type, value in parsed_inputs},
+            }
 
             # --- Parse visuals (images, SVGs) ---
-            visual_idx = 1
-            for img in soup.find_all("img"):
-                visual_name = img.get("alt") or img.get("src") or f"visual_{visual_idx}"
-                visuals[visual_name] = {
-                    "type": "image",
-                    "src": img.get("src"),
-                    "alt": img.get("alt")
-                }
-                components[visual_name] = {
-                    "type": "visual",
-                    "visual_type": "image",
-                    "src": img.get("src"),
-                    "alt": img.get("alt"),
-                    "highlights": []
-                }
-                visual_idx += 1
-            for svg in soup.find_all("svg"):
-                visual_name = f"svg_{visual_idx}"
-                visuals[visual_name] = {
-                    "type": "svg",
-                    "content": str(svg)
-                }
-                components[visual_name] = {
-                    "type": "visual",
-                    "visual_type": "svg",
-                    "content": str(svg),
-                    "highlights": []
-                }
-                visual_idx += 1
+            parsed_imgs = [
+                (img.get("alt") or img.get("src") or f"visual_{idx}", img.get("src"), img.get("alt"))
+                for idx, img in enumerate(nodes["img"], 1)
+            ]
+            parsed_svgs = [
+                (f"svg_{idx}", lxml.html.tostring(svg, encoding="unicode", with_tail=False))
+                for idx, svg in enumerate(nodes["svg"], len(parsed_imgs) + 1)
+            ]
+            visuals = {
+                **{name: {"type": "image", "src": src, "alt": alt} for name, src, alt in parsed_imgs},
+                **{name: {"type": "svg", "content": markup} for name, markup in parsed_svgs},
+            }
+            visual_components = {
+                **{
+                    name: {"type": "visual", "visual_type": "image", "src": src, "alt": alt, "highlights": _NO_HIGHLIGHTS}
+                    for name, src, alt in parsed_imgs
+                },
+                **{
+                    name: {"type": "visual", "visual_type": "svg", "content": markup, "highlights": _NO_HIGHLIGHTS}
+                    for name, markup in parsed_svgs
+                },
+            }
+
+            components = {**table_components, **kpi_components, **filter_components, **visual_components}
 
             # --- Parse layout (sections, divs) ---
-            layout_sections = []
-            for section in soup.find_all(["section", "div"]):
-                sec_id = section.get("id") or section.get("class")
-                layout_sections.append(sec_id)
-            layout["sections"] = layout_sections
+            # Many nodes share the same id/classes; dict.fromkeys drops repeats and keeps first-seen order
+            layout = {
+                "sections": list(dict.fromkeys(section.get("id") or _class_tuple(section) for section in layout_nodes))
+            }
 
 
             return {
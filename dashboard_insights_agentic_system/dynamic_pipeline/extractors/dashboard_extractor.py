@@ -1,6 +1,9 @@
 # dashboard_extractor.py
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+import aiohttp
 
 from connectors.bi_connector import connect_bi_dashboard
 from powerbi_extractor import PowerBIExtractor
@@ -77,17 +80,65 @@ class DashboardExtractor:
             logger.exception("Dashboard extraction failed.")
             return self._fail_result(source, auth_type, str(e))
 
+    def extract_many(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Extract several dashboards at once. Each request holds extract_dashboard's arguments
+        (source, auth_type, drill_state, plus connection kwargs); results keep the input order.
+        """
+        return asyncio.run(self.extract_many_async(requests))
+
+    async def extract_many_async(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Awaitable form of extract_many for callers already running an event loop.
+        Public pages are fetched concurrently on one aiohttp session; private ones run in threads.
+        """
+        async with aiohttp.ClientSession(headers={"User-Agent": "DashboardInsightsAgenticSystem/1.0"}) as session:
+            return list(await asyncio.gather(*(self._extract_one_async(session, req) for req in requests)))
+
+    async def _extract_one_async(self, session: aiohttp.ClientSession, request: Dict[str, Any]) -> Dict[str, Any]:
+        kwargs = dict(request)
+        source = kwargs.pop("source", None)
+        auth_type = kwargs.pop("auth_type", "public")
+        drill_state = kwargs.pop("drill_state", None)
+
+        if auth_type != "public" or source not in ("powerbi", "tableau"):
+            return await asyncio.to_thread(self.extract_dashboard, source, auth_type, drill_state, **kwargs)
+
+        try:
+            # Imported here, under the same module names bi_connector uses, so only the connector
+            # (and its msal / tableauserverclient dependency) for this source is loaded
+            if source == "powerbi":
+                from powerbi_connector import connect_public_powerbi_async
+                url = kwargs.get("embed_url")
+                conn = await connect_public_powerbi_async(url, session)
+            else:
+                from tableau_connector import connect_public_tableau_async
+                url = kwargs.get("public_url")
+                conn = await connect_public_tableau_async(url, session)
+            if conn["status"] != "success":
+                return self._fail_result(source, auth_type, conn.get("error"))
+
+            # Parsing and OCR are CPU/blocking work; keep them off the event loop
+            extractor = self.powerbi_extractor if source == "powerbi" else self.tableau_extractor
+            result = await asyncio.to_thread(
+                extractor.extract_public_dashboard,
+                url,
+                use_ocr=kwargs.get("use_ocr", True),
+                drill_state=drill_state,
+                html_content=conn["content"],
+            )
+            return self._ensure_unified_schema(result, source, auth_type, drill_state)
+        except Exception as e:
+            logger.exception("Dashboard extraction failed.")
+            return self._fail_result(source, auth_type, str(e))
+
     @staticmethod
     def _ensure_unified_schema(result: Dict[str, Any], source: str, auth_type: str, drill_state: Optional[dict] = None) -> Dict[str, Any]:
         # Ensure all keys are present for unified schema, including drill_state and highlights for components
         components = result.get("components", [])
-        # Add highlights field to each component if not present
-        updated_components = []
-        for comp in components:
-            if isinstance(comp, dict):
-                if "highlights" not in comp:
-                    comp["highlights"] = []
-            updated_components.append(comp)
+        for comp in (components.values() if isinstance(components, dict) else components):
+            if isinstance(comp, dict) and "highlights" not in comp:
+                comp["highlights"] = ()
 
         unified = {
             "status": result.get("status", "success"),
@@ -98,7 +149,7 @@ class DashboardExtractor:
             "filters": result.get("filters", []),
             "visuals": result.get("visuals", []),
             "layout": result.get("layout", {}),
-            "components": updated_components,
+            "components": components,
             "html_text": result.get("html_text", ""),
             "drill_state": result.get("drill_state", drill_state or {}),
             "error": result.get("error", None)
@@ -1,12 +1,105 @@
 # tableau_extractor.py
+import codecs
+import csv
 import logging
-from typing import Dict, Any, Optional
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from utils.ocr_helper import OCRHelper
 
 logger = logging.getLogger(__name__)
 
+# OCR for public pages runs here so it overlaps with fetching and parsing the HTML
+_ocr_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tableau-ocr")
+
+# Heuristic KPI candidates when OCR is off: headings/spans/divs whose text contains an ASCII digit.
+# translate() does the digit test inside libxml2, so digit-free nodes never reach Python.
+_KPI_CANDIDATES = etree.XPath(
+    "//*[self::h1 or self::h2 or self::h3 or self::span or self::div][translate(., '0123456789', '') != .]"
+)
+
+# C-level "contains a digit" test for candidate text; stops at the first match
+_HAS_DIGIT = re.compile(r"\d").search
+
+# Anonymous div/section widgets with less text than this are not emitted as components
+_MIN_WIDGET_TEXT = 3
+
+# Every tag extract_public_dashboard reads, gathered in a single tree.iter walk
+_COLLECTED_TAGS = ("table", "select", "input", "img", "svg", "section", "div")
+
+# Shared, immutable "highlights" placeholder (see PowerBI_extractor); replaced on first highlight
+_NO_HIGHLIGHTS = ()
+
+
+def _text_spans(root) -> tuple:
+    """
+    One walk over root collecting its stripped, non-empty text nodes (script/style bodies left out)
+    in document order, plus each element's (start, end) slice of that list. Joining an element's
+    slice with a separator gives bs4's get_text(separator, strip=True) for it, without walking its
+    subtree again, so nested containers don't re-read their descendants' text.
+    """
+    pieces: List[str] = []
+    spans: Dict[Any, Any] = {}
+
+    def add(text: Optional[str]) -> None:
+        if text:
+            text = text.strip()
+            if text:
+                pieces.append(text)
+
+    spans[root] = len(pieces)
+    add(root.text)
+    stack = [(root, iter(root))]
+    while stack:
+        el, children = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            spans[el] = (spans[el], len(pieces))
+            if stack:
+                add(el.tail)
+        elif not isinstance(child.tag, str) or child.tag in ("script", "style"):
+            # Comments and script/style elements contribute only the text after them
+            add(child.tail)
+        else:
+            spans[child] = len(pieces)
+            add(child.text)
+            stack.append((child, iter(child)))
+    return pieces, spans
+
+
+def _class_list(el) -> Optional[list]:
+    """
+    The element's classes as a list, as bs4 reported the multi-valued "class" attribute, or None.
+    """
+    cls = el.get("class")
+    return cls.split() if cls else None
+
+
+def _iter_csv_rows(chunks: Iterable[bytes]) -> Iterator[List[str]]:
+    """
+    Parse CSV rows lazily from the byte chunks tableauserverclient streams for a view,
+    so a large export is never held in memory as one blob.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+
+    def lines() -> Iterator[str]:
+        pending = ""
+        for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *complete, pending = pending.split("\n")
+            for line in complete:
+                # Keep the newline so csv can rejoin quoted fields that span lines
+                yield line + "\n"
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
+
+    return csv.reader(lines())
+
 
 class TableauExtractor:
     """
@@ -23,41 +116,58 @@ class TableauExtractor:
     def extract_private_dashboard(self, server, view_id: str, drill_state: Optional[dict] = None) -> Dict[str, Any]:
         """
         Extracts data using the Tableau Server/Online REST API.
+        The view's CSV export is returned under "data_iter" as a lazy iterator of rows (lists of
+        strings, header row first) instead of a materialized "data" dict; it is an empty iterator
+        when extraction fails, so both paths share one schema.
         """
         try:
             # Retrieve the view item
             view_item = server.views.get_by_id(view_id)
 
-            # Retrieve CSV data for that view
+            # populate_csv sets up a streamed download; view_item.csv yields byte chunks as they arrive
             server.views.populate_csv(view_item)
-            csv_data = view_item.csv
 
             return {
                 "status": "success",
                 "source": "tableau",
                 "auth_type": "private",
-                "data": csv_data,
+                "data_iter": _iter_csv_rows(view_item.csv),
                 "drill_state": drill_state or {},
                 "error": None
             }
 
         except Exception as e:
             logger.exception("Private Tableau extraction failed.")
-            return {"status": "failed", "data": {}, "error": str(e)}
+            return {
+                "status": "failed",
+                "source": "tableau",
+                "auth_type": "private",
+                "data_iter": iter(()),
+                "drill_state": drill_state or {},
+                "error": str(e)
+            }
 
-    def extract_public_dashboard(self, public_url: str, use_ocr: bool = True, drill_state: Optional[dict] = None) -> Dict[str, Any]:
+    def extract_public_dashboard(self, public_url: str, use_ocr: bool = True, drill_state: Optional[dict] = None,
+                                 html_content: Optional[str] = None) -> Dict[str, Any]:
         """
         Extracts Tableau Public dashboard content via HTML scraping and optional OCR.
+        If html_content is given the page is not fetched again.
         """
         try:
-            from dynamic_pipeline.connectors.bi_connector import connect_public_tableau
-            conn = connect_public_tableau(public_url)
-            if conn["status"] != "success":
-                return {"status": "failed", "data": {}, "drill_state": drill_state or {}, "error": conn.get("error")}
+            # OCR takes its own screenshot of public_url, independent of the HTML; start it first
+            ocr_future = _ocr_pool.submit(self.ocr.extract_from_url, public_url) if use_ocr else None
 
-            html_content = conn["content"]
-            soup = BeautifulSoup(html_content, "html.parser")
+            if html_content is None:
+                from tableau_connector import connect_public_tableau
+                conn = connect_public_tableau(public_url)
+                if conn["status"] != "success":
+                    if ocr_future is not None:
+                        ocr_future.cancel()
+                    return {"status": "failed", "data": {}, "drill_state": drill_state or {}, "error": conn.get("error")}
+                html_content = conn["content"]
 
+            # Plain lxml: parsing and queries run in C with no bs4 wrapper object per node
+            tree = lxml.html.document_fromstring(html_content if html_content.strip() else "<html></html>")
 
             # --- Unified, componentized schema for agent reasoning ---
             extracted_data = {
@@ -70,16 +180,35 @@ class TableauExtractor:
                 "visuals": [],
                 "layout": {},
                 "components": [],
-                "html_text": soup.get_text(separator=" ", strip=True),
+                "html_text": "",
                 "drill_state": drill_state or {},
                 "error": None
             }
 
+            # Every element's text comes from one shared pass instead of a subtree walk per element
+            pieces, spans = _text_spans(tree)
+
+            def text_of(el, separator: str = "") -> str:
+                start, end = spans[el]
+                return separator.join(pieces[start:end])
+
+            extracted_data["html_text"] = text_of(tree, " ")
+
+            # Walk the tree once, bucketing every element the sections below need (document order kept)
+            nodes = {name: [] for name in ("table", "select", "input", "img", "svg")}
+            layout_nodes = []
+            for el in tree.iter(*_COLLECTED_TAGS):
+                name = el.tag
+                if name in nodes:
+                    nodes[name].append(el)
+                if name in ("section", "div"):
+                    layout_nodes.append(el)
+
             # --- Parse tables ---
-            for table in soup.find_all("table"):
+            for table in nodes["table"]:
                 rows = []
-                for tr in table.find_all("tr"):
-                    cells = [td.get_text(strip=True) for td in tr.find_all(["td", "th"])]
+                for tr in table.iter("tr"):
+                    cells = [text_of(td) for td in tr.iter("td", "th")]
                     if cells:
                         rows.append(cells)
                 if rows:
@@ -92,12 +221,12 @@ class TableauExtractor:
                         "type": "table",
                         "headers": table_obj["headers"],
                         "rows": table_obj["rows"],
-                        "highlights": []
+                        "highlights": _NO_HIGHLIGHTS
                     })
 
             # --- Parse KPIs (from OCR or heuristics) ---
-            if use_ocr:
-                ocr_result = self.ocr.extract_from_url(public_url)
+            if ocr_future is not None:
+                ocr_result = ocr_future.result()
                 if ocr_result["status"] == "success":
                     extracted_data["kpis"] = ocr_result.get("numbers", [])
                     for idx, num in enumerate(extracted_data["kpis"]):
@@ -105,16 +234,16 @@ class TableauExtractor:
                             "type": "kpi",
                             "name": f"kpi_{idx+1}",
                             "value": num,
-                            "highlights": []
+                            "highlights": _NO_HIGHLIGHTS
                         })
                 else:
                     extracted_data["error"] = f"OCR failed: {ocr_result['error']}"
             else:
                 # Heuristic: look for numbers in prominent tags
                 kpi_candidates = []
-                for tag in soup.find_all(["h1", "h2", "h3", "span", "div"]):
-                    text = tag.get_text(strip=True)
-                    if text and any(char.isdigit() for char in text):
+                for tag in _KPI_CANDIDATES(tree):
+                    text = text_of(tag)
+                    if text and _HAS_DIGIT(text):
                         kpi_candidates.append(text)
                 extracted_data["kpis"] = kpi_candidates
                 for idx, num in enumerate(kpi_candidates):
@@ -122,12 +251,12 @@ class TableauExtractor:
                         "type": "kpi",
                         "name": f"kpi_{idx+1}",
                         "value": num,
-                        "highlights": []
+                        "highlights": _NO_HIGHLIGHTS
                     })
 
             # --- Parse filters (heuristic: dropdowns, input fields) ---
-            for select in soup.find_all("select"):
-                options = [opt.get_text(strip=True) for opt in select.find_all("option")]
+            for select in nodes["select"]:
+                options = [text_of(opt) for opt in select.iter("option")]
                 filter_obj = {
                     "type": "dropdown",
                     "options": options
@@ -137,9 +266,9 @@ class TableauExtractor:
                     "type": "filter",
                     "filter_type": "dropdown",
                     "options": options,
-                    "highlights": []
+                    "highlights": _NO_HIGHLIGHTS
                 })
-            for inp in soup.find_all("input"):
+            for inp in nodes["input"]:
                 filter_obj = {
                     "type": inp.get("type", "input"),
                     "name": inp.get("name"),
@@ -151,11 +280,11 @@ class TableauExtractor:
                     "filter_type": inp.get("type", "input"),
                     "name": inp.get("name"),
                     "value": inp.get("value"),
-                    "highlights": []
+                    "highlights": _NO_HIGHLIGHTS
                 })
 
             # --- Parse visuals (heuristic: images, svg, charts) ---
-            for img in soup.find_all("img"):
+            for img in nodes["img"]:
                 visual_obj = {
                     "type": "image",
                     "src": img.get("src"),
@@ -167,41 +296,51 @@ class TableauExtractor:
                     "visual_type": "image",
                     "src": img.get("src"),
                     "alt": img.get("alt"),
-                    "highlights": []
+                    "highlights": _NO_HIGHLIGHTS
                 })
-            for svg in soup.find_all("svg"):
+            for svg in nodes["svg"]:
+                # Serialize the subtree once; visuals and components share the same string
+                svg_markup = lxml.html.tostring(svg, encoding="unicode", with_tail=False)
                 visual_obj = {
                     "type": "svg",
-                    "content": str(svg)
+                    "content": svg_markup
                 }
                 extracted_data["visuals"].append(visual_obj)
                 extracted_data["components"].append({
                     "type": "visual",
                     "visual_type": "svg",
-                    "content": str(svg),
-                    "highlights": []
+                    "content": svg_markup,
+                    "highlights": _NO_HIGHLIGHTS
                 })
 
-            # --- Parse layout (basic: sections, divs, grid) ---
-            layout = {}
-            sections = soup.find_all(["section", "div"])
-            layout["sections"] = [sec.get("id") or sec.get("class") for sec in sections]
+            # --- Parse layout (basic: sections, divs, grid) and components (heuristic: dashboard widgets) ---
+            # One pass over the div/section nodes reads each node's id/class once for both outputs.
+            # Every container is a widget candidate; anonymous ones (no id/class) with next to no
+            # text are left out, whatever their nesting depth.
+            layout_sections = []
+            widgets = []
+            for container in layout_nodes:
+                el_id = container.get("id")
+                el_cls = _class_list(container)
+                layout_sections.append(el_id or el_cls)
+                text = text_of(container)
+                if el_id is None and el_cls is None and len(text) < _MIN_WIDGET_TEXT:
+                    continue
+                widgets.append({
+                    "id": el_id,
+                    "class": el_cls,
+                    "text": text,
+                    "highlights": _NO_HIGHLIGHTS
+                })
+
+            layout = {"sections": layout_sections}
             extracted_data["layout"] = layout
             extracted_data["components"].append({
                 "type": "layout",
                 "sections": layout["sections"],
-                "highlights": []
+                "highlights": _NO_HIGHLIGHTS
             })
-
-            # --- Parse components (heuristic: dashboard widgets) ---
-            for widget in soup.find_all(["div", "section"]):
-                comp = {
-                    "id": widget.get("id"),
-                    "class": widget.get("class"),
-                    "text": widget.get_text(strip=True),
-                    "highlights": []
-                }
-                extracted_data["components"].append(comp)
+            extracted_data["components"].extend(widgets)
 
             return extracted_data
 
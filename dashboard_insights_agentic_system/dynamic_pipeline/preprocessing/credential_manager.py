@@ -1,3 +1,21 @@
+# (output key, key in the user-supplied credentials) per source
+_SCHEMA = {
+    "powerbi": (
+        ("client_id", "client_id"),
+        ("client_secret", "client_secret"),
+        ("tenant_id", "tenant_id"),
+        ("username", "username"),
+        ("password", "password"),
+    ),
+    "tableau": (
+        ("personal_access_token", "token"),
+        ("site", "site"),
+        ("username", "username"),
+        ("password", "password"),
+    ),
+}
+
+
 def get_credentials(source: str, credentials: dict = None) -> dict:
     """
     Retrieves and validates credentials for a private dashboard.
@@ -9,22 +27,6 @@ def get_credentials(source: str, credentials: dict = None) -> dict:
     Returns:
         dict: Validated credentials (tokens, keys, etc.).
     """
-    if source == "powerbi":
-        return {
-            "client_id": credentials.get("client_id"),
-            "client_secret": credentials.get("client_secret"),
-            "tenant_id": credentials.get("tenant_id"),
-            "username": credentials.get("username"),
-            "password": credentials.get("password")
-        }
-    elif source == "tableau":
-        return {
-            "personal_access_token": credentials.get("token"),
-            "site": credentials.get("site"),
-            "username": credentials.get("username"),
-            "password": credentials.get("password")
-        }
-    else:
-        return {}
+    return {out: credentials.get(src) for out, src in _SCHEMA.get(source, ())}
     
     
@@ -1,16 +1,71 @@
 # preprocessing.py
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import ijson
+import tableauserverclient as TSC
+
+# Views requested per REST page, and how many pages are fetched at once
+_VIEW_PAGE_SIZE = 1000
+_VIEW_PAGE_WORKERS = 8
+
+
 def preprocess_dashboard_data(connection_obj):
     if connection_obj["source"] == "powerbi":
         session = connection_obj["session"]
         # Example: list reports in workspace
         workspace_id = "YOUR_WORKSPACE_ID"
-        reports = session.get(
-            f"https://api.powerbi.com/v1.0/myorg/groups/{workspace_id}/reports"
-        ).json()
-        return reports
+        # Each page is parsed as it streams in; the reports are returned as a list, like the Tableau views
+        return list(_iter_powerbi_reports(
+            session, f"https://api.powerbi.com/v1.0/myorg/groups/{workspace_id}/reports"
+        ))
 
     elif connection_obj["source"] == "tableau":
         server = connection_obj["server"]
         # Example: list all views
-        all_views, _ = server.views.get()
-        return [{"name": v.name, "id": v.id} for v in all_views]
\ No newline at end of file
+        return _list_tableau_views(server)
+
+
+def _iter_powerbi_reports(session, url):
+    """
+    Yield each report dict of a Power BI list response as it is parsed off the wire, following
+    @odata.nextLink until the last page, so no raw page body is buffered whole. An error status
+    (e.g. 401/429) raises instead of being read as an empty last page.
+    """
+    while url:
+        next_link = None
+        with session.get(url, stream=True) as resp:
+            resp.raise_for_status()
+            resp.raw.decode_content = True
+            builder = None
+            for prefix, event, value in ijson.parse(resp.raw, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == "value.item" and event == "end_map":
+                        yield builder.value
+                        builder = None
+                elif prefix == "value.item" and event == "start_map":
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif prefix == "@odata.nextLink":
+                    next_link = value
+        url = next_link
+
+
+def _list_tableau_views(server) -> list:
+    """
+    List every view on the site. The first page reports the total count; the remaining pages
+    are fetched concurrently over the server's pooled session and concatenated in page order.
+    """
+    first_page, pagination = server.views.get(TSC.RequestOptions(pagenumber=1, pagesize=_VIEW_PAGE_SIZE))
+    total_pages = math.ceil(pagination.total_available / _VIEW_PAGE_SIZE)
+
+    def fetch_page(page_number):
+        views, _ = server.views.get(TSC.RequestOptions(pagenumber=page_number, pagesize=_VIEW_PAGE_SIZE))
+        return views
+
+    pages = [first_page]
+    if total_pages > 1:
+        with ThreadPoolExecutor(max_workers=min(_VIEW_PAGE_WORKERS, total_pages - 1)) as pool:
+            pages.extend(pool.map(fetch_page, range(2, total_pages + 1)))
+    return [{"name": v.name, "id": v.id} for views in pages for v in views]
\ No newline at end of file
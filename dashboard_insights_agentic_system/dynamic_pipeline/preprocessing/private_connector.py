@@ -1,5 +1,11 @@
-import requests
-from typing import Dict, Any
+import base64
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+
+import msal
 
 # Tableau SDK
 import tableauserverclient as TSC
@@ -8,6 +14,105 @@ import tableauserverclient as TSC
 from powerbiclient import Report
 from powerbiclient.authentication import DeviceCodeLogin
 
+from utils.http_utils import build_http_session
+
+POWERBI_SCOPES = ["https://analysis.windows.net/powerbi/api/.default"]
+# Tokens are refreshed this many seconds before their exp claim
+TOKEN_REFRESH_MARGIN = 300
+MSAL_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "dashboard_insights", "msal.bin")
+
+# (tenant_id, client_id) -> access token; spares a device-code prompt per connect
+_token_cache: Dict[Tuple[str, str], str] = {}
+_msal_cache: Optional[msal.SerializableTokenCache] = None
+_token_lock = threading.Lock()
+
+
+def _token_expiry(token: str) -> float:
+    """
+    Read the exp claim of a JWT access token (0 if it can't be decoded).
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except Exception:
+        return 0.0
+
+
+def _token_is_fresh(token: Optional[str]) -> bool:
+    return bool(token) and _token_expiry(token) - TOKEN_REFRESH_MARGIN > time.time()
+
+
+def _load_msal_cache() -> msal.SerializableTokenCache:
+    """
+    Return the process-wide MSAL token cache, loading it from disk on first use.
+    """
+    global _msal_cache
+    if _msal_cache is None:
+        _msal_cache = msal.SerializableTokenCache()
+        if os.path.exists(MSAL_CACHE_PATH):
+            with open(MSAL_CACHE_PATH, "r") as f:
+                _msal_cache.deserialize(f.read())
+    return _msal_cache
+
+
+def _save_msal_cache(cache: msal.SerializableTokenCache) -> None:
+    if cache.has_state_changed:
+        os.makedirs(os.path.dirname(MSAL_CACHE_PATH), exist_ok=True)
+        # Owner-only: the cache holds refresh tokens
+        with open(os.open(MSAL_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+            f.write(cache.serialize())
+
+
+def _acquire_msal_device_token(tenant_id: str, client_id: str) -> str:
+    """
+    Get a Power BI token for a public client app: silently from the persisted MSAL cache
+    when an account is cached, via the device code flow otherwise.
+    """
+    cache = _load_msal_cache()
+    app = msal.PublicClientApplication(
+        client_id, authority=f"https://login.microsoftonline.com/{tenant_id}", token_cache=cache
+    )
+    result = None
+    accounts = app.get_accounts()
+    if accounts:
+        result = app.acquire_token_silent(POWERBI_SCOPES, account=accounts[0])
+    if not result:
+        flow = app.initiate_device_flow(scopes=POWERBI_SCOPES)
+        if "user_code" not in flow:
+            raise RuntimeError(f"Failed to start device code flow: {flow.get('error_description')}")
+        # This prompts in terminal for device code entry
+        print(flow["message"])
+        result = app.acquire_token_by_device_flow(flow)
+    _save_msal_cache(cache)
+    if "access_token" not in result:
+        raise RuntimeError(f"Failed to acquire Power BI token: {result.get('error_description')}")
+    return result["access_token"]
+
+
+def get_powerbi_access_token(credentials: Dict[str, Any]) -> str:
+    """
+    Return a Power BI access token, reusing a cached one until shortly before it expires.
+    With a client_id in the credentials the token comes from MSAL (cache persisted to disk);
+    otherwise from powerbiclient's DeviceCodeLogin.
+    """
+    key = (credentials.get("tenant_id", "organizations"), credentials.get("client_id", ""))
+    with _token_lock:
+        token = _token_cache.get(key)
+        if _token_is_fresh(token):
+            return token
+
+        if key[1]:
+            token = _acquire_msal_device_token(*key)
+        else:
+            # This prompts in terminal for device code entry
+            device_auth = DeviceCodeLogin()
+            token_details = device_auth.get_access_token()
+            token = token_details["accessToken"]
+        _token_cache[key] = token
+        return token
+
+
 def connect_private_dashboard(url: str, source: str, credentials: Dict[str, Any]) -> Dict[str, Any]:
     """
     Connect to a private Power BI or Tableau dashboard using official APIs.
@@ -22,14 +127,11 @@ def connect_private_dashboard(url: str, source: str, credentials: Dict[str, Any]
     """
 
     if source.lower() == "powerbi":
-        # Authenticate via Azure AD Device Code Flow (simplest for dev)
+        # Authenticate via Azure AD Device Code Flow (simplest for dev); cached across calls
         if "access_token" not in credentials:
-            # This prompts in terminal for device code entry
-            device_auth = DeviceCodeLogin()
-            token_details = device_auth.get_access_token()
-            credentials["access_token"] = token_details["accessToken"]
+            credentials["access_token"] = get_powerbi_access_token(credentials)
 
-        session = requests.Session()
+        session = build_http_session()
         session.headers.update({
             "Authorization": f"Bearer {credentials['access_token']}",
             "Content-Type": "application/json"
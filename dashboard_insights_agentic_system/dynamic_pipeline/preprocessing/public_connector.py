@@ -1,21 +1,59 @@
+import threading
+from typing import Tuple
+
+import orjson
 import requests
+from cachetools import LRUCache
 from tableau_api_lib import TableauServerConnection
 from tableau_api_lib.utils.querying import get_views_dataframe
 
-def connect_public_dashboard(url: str, source: str = "generic") -> dict:
+from utils.http_utils import build_http_session, conditional_headers
+
+# Pooled session reused by every public fetch in this module
+_SESSION = build_http_session()
+
+# url -> (ETag, Last-Modified, response) of the last 200 response, used to revalidate repeat fetches
+_validators: LRUCache = LRUCache(maxsize=256)
+_validators_lock = threading.Lock()
+
+
+def _conditional_get(url: str) -> Tuple[requests.Response, bool]:
+    """
+    GET a URL, sending If-None-Match/If-Modified-Since from its previous response when known.
+    Returns (response, not_modified); on a 304 the response is the previously fetched 200.
+    """
+    with _validators_lock:
+        cached = _validators.get(url)
+    response = _SESSION.get(url, headers=conditional_headers(cached))
+    if response.status_code == 304 and cached:
+        return cached[2], True
+    if response.status_code == 200:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            with _validators_lock:
+                _validators[url] = (etag, last_modified, response)
+    return response, False
+
+
+def connect_public_dashboard(url: str, source: str = "generic", if_changed: bool = False) -> dict:
     """
     Connects to a public dashboard (Power BI, Tableau, or generic).
     
     Args:
         url (str): Public dashboard URL.
         source (str): 'powerbi', 'tableau', or 'generic'.
+        if_changed (bool): For 'generic'/'powerbi', return {"status": "not_modified"} instead of
+            the cached content when the server reports the resource unchanged since the last fetch.
     
     Returns:
         dict: Response containing raw data or session info.
     """
     if source == "generic":
-        # Basic GET request
-        response = requests.get(url)
+        # Basic GET request, revalidated against the previous fetch of the same URL
+        response, not_modified = _conditional_get(url)
+        if not_modified and if_changed:
+            return {"status": "not_modified"}
         if response.status_code == 200:
             return {"status": "success", "content": response.text}
         return {"status": "failed", "error": response.status_code}
@@ -23,9 +61,11 @@ def connect_public_dashboard(url: str, source: str = "generic") -> dict:
     elif source == "powerbi":
         # Public Power BI reports are usually embedded via iframe with an embed token
         # Example: using requests for public JSON endpoint if available
-        response = requests.get(url)
+        response, not_modified = _conditional_get(url)
+        if not_modified and if_changed:
+            return {"status": "not_modified"}
         if response.status_code == 200:
-            return {"status": "success", "content": response.json()}
+            return {"status": "success", "content": orjson.loads(response.content)}
         return {"status": "failed", "error": response.status_code}
 
     elif source == "tableau":
@@ -1,6 +1,25 @@
+import threading
+from typing import Optional
+
 import requests
+from cachetools import TTLCache
 from urllib.parse import urlparse
 
+from utils.http_utils import build_http_session, conditional_headers
+
+# Shared keep-alive session: repeated probes of the same host skip the TCP/TLS handshake
+_SESSION = build_http_session()
+
+# Probe outcomes per full URL (the query identifies publish-to-web reports), fresh for 10 minutes
+_probe_cache = TTLCache(maxsize=1024, ttl=600)
+# ETag/Last-Modified of URLs last found public; kept longer than the outcomes so an expired
+# entry is revalidated with a conditional HEAD (a 304 means it is still public)
+_probe_validators = TTLCache(maxsize=1024, ttl=86400)
+_probe_lock = threading.Lock()
+
+# Sign-in hosts: a URL on (or redirecting to) one of these is never a public dashboard
+_AUTH_HOSTS = ("login.microsoftonline.com", "login.live.com", "id.tableau.com")
+
 def is_public_dashboard(url: str) -> bool:
     """
     Determines if the dashboard URL points to a public dashboard.
@@ -19,21 +38,55 @@ def is_public_dashboard(url: str) -> bool:
     if "app.powerbi.com" in parsed_url.netloc and "/public/report" in parsed_url.path:
         return True
 
-    # Step 2: Try a request and check redirect/auth behavior
+    # Known-private patterns need no network probe either: sign-in pages, and Power BI workspace
+    # content (/groups/...), which always requires a signed-in user. Publish-to-web links
+    # (app.powerbi.com/view?r=...) are still probed
+    netloc = parsed_url.netloc.lower()
+    if netloc in _AUTH_HOSTS:
+        return False
+    if netloc == "app.powerbi.com" and parsed_url.path.startswith("/groups/"):
+        return False
+
+    # Step 2: Try a request and check redirect/auth behavior (cached per dashboard URL)
+    key = (parsed_url.scheme, parsed_url.netloc, parsed_url.path, parsed_url.query)
+    with _probe_lock:
+        cached = _probe_cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = _probe(url, key)
+    if result is None:
+        return False  # network error; not cached so the next call retries
+    with _probe_lock:
+        _probe_cache[key] = result
+    return result
+
+
+def _probe(url: str, key: tuple) -> Optional[bool]:
+    """
+    HEAD the URL and decide whether it is reachable without authentication; None on request errors.
+    """
+    with _probe_lock:
+        validators = _probe_validators.get(key)
+    headers = conditional_headers(validators)
     try:
-        response = requests.head(url, allow_redirects=True, timeout=5)
+        response = _SESSION.head(url, allow_redirects=True, timeout=5, headers=headers)
+
+        if response.status_code == 304 and validators:
+            return True  # unchanged since it was last found public
 
         if response.status_code in [401, 403]:
             return False  # requires authentication
 
         # Look for redirects to login pages
-        if any(auth_domain in response.url.lower() for auth_domain in [
-            "login.microsoftonline.com",
-            "login.live.com",
-            "id.tableau.com"
-        ]):
+        if any(auth_domain in response.url.lower() for auth_domain in _AUTH_HOSTS):
             return False
 
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            with _probe_lock:
+                _probe_validators[key] = (etag, last_modified)
         return True  # Accessible without auth
     except requests.RequestException:
-        return False
\ No newline at end of file
+        return None
@@ -5,6 +5,14 @@ from typing import Any, Dict, List, Optional, Union
 import pandas as pd
 from pandas import json_normalize
 
+# Any run of characters other than letters/digits (underscores included) collapses to one "_"
+_NON_ALNUM = re.compile(r"[^0-9a-zA-Z]+")
+# Value patterns used by convert_data_types to detect date and numeric string columns
+_DATE_RE = re.compile(r"^\d{4}-\d{1,2}-\d{1,2}")
+_NUM_RE = re.compile(r"^-?\d+(\.\d+)?$")
+# Characters normalize_values strips before parsing a value as a number
+_CURRENCY_RE = re.compile(r"[\s$,%]")
+
 
 class DataCleaner:
     def clean_unified_dashboard_data(self, extracted: Dict[str, Any]) -> Dict[str, Any]:
@@ -38,49 +46,34 @@ class DataCleaner:
             else:
                 cleaned["tables"].append(table)
 
+        # KPIs, filters, visuals and tabular components are single-record dicts, each cleaned on its
+        # own; flat ones take the dict fast path instead of a one-row pandas pipeline
+
         # --- Clean KPIs ---
-        for kpi in extracted.get("kpis", []):
-            if isinstance(kpi, dict):
-                df = pd.DataFrame([kpi])
-                df = self.clean(df)
-                cleaned["kpis"].append(df)
-            else:
-                cleaned["kpis"].append(kpi)
+        cleaned["kpis"] = [self._clean_item(kpi) if isinstance(kpi, dict) else kpi for kpi in extracted.get("kpis", [])]
 
         # --- Clean filters ---
-        for filt in extracted.get("filters", []):
-            if isinstance(filt, dict):
-                df = pd.DataFrame([filt])
-                df = self.clean(df)
-                cleaned["filters"].append(df)
-            else:
-                cleaned["filters"].append(filt)
+        cleaned["filters"] = [self._clean_item(filt) if isinstance(filt, dict) else filt for filt in extracted.get("filters", [])]
 
         # --- Clean visuals ---
-        for vis in extracted.get("visuals", []):
-            if isinstance(vis, dict):
-                df = pd.DataFrame([vis])
-                df = self.clean(df)
-                cleaned["visuals"].append(df)
-            else:
-                cleaned["visuals"].append(vis)
+        cleaned["visuals"] = [self._clean_item(vis) if isinstance(vis, dict) else vis for vis in extracted.get("visuals", [])]
 
         # --- Clean components ---
         for comp in extracted.get("components", []):
             if isinstance(comp, dict):
                 # Ensure highlights field is present
                 if "highlights" not in comp:
-                    comp["highlights"] = []
-                # Try to infer type and clean accordingly
-                comp_type = comp.get("type", "unknown")
+                    comp["highlights"] = ()
                 # Clean tabular/structured components, preserve highlights and drill_state
-                if comp_type in ["table", "kpi", "filter", "visual"]:
+                if comp.get("type", "unknown") in ["table", "kpi", "filter", "visual"]:
                     # Exclude highlights and drill_state from DataFrame, add back after cleaning
                     highlights = comp.pop("highlights", [])
                     drill_state = comp.pop("drill_state", None)
-                    df = pd.DataFrame([comp])
-                    df = self.clean(df)
-                    comp_cleaned = df.to_dict(orient="records")[0]
+                    if self._is_flat(comp):
+                        comp_cleaned = self._clean_dict(comp)
+                    else:
+                        records = self.clean(pd.DataFrame([comp])).to_dict(orient="records")
+                        comp_cleaned = records[0] if records else {}
                     comp_cleaned["highlights"] = highlights
                     if drill_state is not None:
                         comp_cleaned["drill_state"] = drill_state
@@ -122,11 +115,90 @@ class DataCleaner:
         }
         self.missing_value_strategy = missing_value_strategy
         self.fill_constant = fill_constant
+        # alias -> standardized name, built once rather than on every normalize_column_names call
+        self._reverse_semantic_map = {
+            alias: std for std, aliases in self.semantic_map.items() for alias in aliases
+        }
+        # Arrow-backed strings run .str ops in Arrow's kernels; plain StringDtype if pyarrow is absent
+        try:
+            self._string_dtype = pd.StringDtype("pyarrow")
+        except ImportError:
+            self._string_dtype = pd.StringDtype()
 
     # ------------------------
     # Core cleaning steps
     # ------------------------
 
+    @staticmethod
+    def _is_flat(record: Dict[str, Any]) -> bool:
+        return not any(isinstance(v, (list, tuple, set, dict)) for v in record.values())
+
+    def _clean_dict(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Applies the clean() pipeline to a single flat record without building a DataFrame.
+        Gives the same values clean() would for a one-row frame; {} if the row is dropped.
+        """
+        keys = self._normalize_names(record)
+
+        # convert_data_types: on one row a string column is all-date, all-number or text
+        values = {}
+        text_keys = set()
+        for key, value in zip(keys, record.values()):
+            if isinstance(value, str):
+                if _DATE_RE.match(value):
+                    value = pd.to_datetime(value, errors="coerce")
+                elif _NUM_RE.match(value):
+                    value = pd.to_numeric(value)
+                else:
+                    text_keys.add(key)
+            elif value is None:
+                text_keys.add(key)
+            values[key] = value
+
+        # handle_missing_values
+        missing = [key for key, value in values.items() if pd.isna(value)]
+        if missing:
+            if self.missing_value_strategy == "drop":
+                return {}
+            elif self.missing_value_strategy == "fill_constant":
+                values.update((key, self.fill_constant) for key in missing)
+            elif self.missing_value_strategy != "fill_mean":
+                raise ValueError(f"Unsupported missing value strategy: {self.missing_value_strategy}")
+
+        # normalize values / standardize categories / parse dates for the text values
+        for key in text_keys:
+            value = values[key]
+            if value is None:
+                values[key] = float("nan")
+                continue
+            text = str(value)
+            number = pd.to_numeric(_CURRENCY_RE.sub("", text), errors="coerce")
+            if not pd.isna(number):
+                values[key] = number / 100.0 if "%" in text else number
+                continue
+            if not isinstance(value, str):
+                continue
+            text = text.lower().strip()
+            text = self.synonym_map.get(text, text)
+            try:
+                parsed = pd.to_datetime(text, errors="coerce")
+            except Exception:
+                parsed = pd.NaT
+            values[key] = text if pd.isna(parsed) else parsed
+
+        return {key: value.item() if hasattr(value, "item") else value for key, value in values.items()}
+
+    def _clean_item(self, item: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Cleans a single-record dict into the one-row DataFrame clean() would give for it.
+        """
+        if not self._is_flat(item):
+            return self.clean(pd.DataFrame([item]))
+        row = self._clean_dict(item)
+        if row or not item:
+            return pd.DataFrame([row])
+        return pd.DataFrame(columns=self._normalize_names(item))
+
     def flatten_data(self, data: Any) -> List[Dict[str, Any]]:
         """
         Recursively flattens nested dict/list structures into a list of dicts.
@@ -142,22 +214,17 @@ class DataCleaner:
         """
         Standardizes and deduplicates column names.
         """
-        # Lowercase, strip spaces, replace non-alphanumeric with underscores
-        cols = [
-            re.sub(r"[^0-9a-zA-Z_]+", "_", col.strip().lower())
-            for col in df.columns
-        ]
-        # Collapse multiple underscores and strip edges
-        cols = [re.sub(r"_+", "_", c).strip("_") for c in cols]
-        # Deduplicate
-        cols = self._deduplicate_columns(cols)
-        # Apply semantic mapping
-        reverse_map = {alias: std for std, aliases in self.semantic_map.items() for alias in aliases}
-        cols = [reverse_map.get(c, c) for c in cols]
-
-        df.columns = cols
+        df.columns = self._normalize_names(df.columns)
         return df
 
+    def _normalize_names(self, names) -> List[str]:
+        # Lowercase, strip spaces, turn each run of non-alphanumerics (underscores included) into a
+        # single underscore and strip edges; one regex pass instead of substitute-then-collapse
+        cols = [_NON_ALNUM.sub("_", col.strip().lower()).strip("_") for col in names]
+        # Deduplicate, then apply semantic mapping
+        reverse_map = self._reverse_semantic_map
+        return [reverse_map.get(c, c) for c in self._deduplicate_columns(cols)]
+
     def _deduplicate_columns(self, columns: List[str]) -> List[str]:
         counts = Counter()
         new_cols = []
@@ -166,6 +233,15 @@ class DataCleaner:
             new_cols.append(f"{col}_{counts[col]}" if counts[col] > 1 else col)
         return new_cols
 
+    def to_string_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Casts object columns that hold only strings to the cleaner's string dtype.
+        """
+        for col in df.select_dtypes(include=["object"]).columns:
+            if pd.api.types.infer_dtype(df[col], skipna=True) == "string":
+                df[col] = df[col].astype(self._string_dtype)
+        return df
+
     def convert_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Converts string columns to appropriate numeric or datetime types where possible.
@@ -175,16 +251,18 @@ class DataCleaner:
                 continue
 
             if pd.api.types.is_string_dtype(df[col]):
-                non_null_vals = df[col].dropna().astype(str)
-                if non_null_vals.empty:
+                non_null = int(df[col].notna().sum())
+                if not non_null:
                     continue
 
-                if non_null_vals.str.match(r"\d{4}-\d{1,2}-\d{1,2}").mean() > 0.8:
+                # One string view per column; both pattern checks reuse it (nulls never match)
+                values = df[col].astype("string")
+                if values.str.match(_DATE_RE, na=False).sum() / non_null > 0.8:
                     df[col] = pd.to_datetime(df[col], errors="coerce")
-                elif non_null_vals.str.match(r"^-?\d+(\.\d+)?$").mean() > 0.8:
+                elif values.str.match(_NUM_RE, na=False).sum() / non_null > 0.8:
                     df[col] = pd.to_numeric(df[col], errors="coerce")
                 else:
-                    df[col] = df[col].astype(str)
+                    df[col] = df[col].astype(self._string_dtype)
         return df
 
     def handle_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -194,12 +272,12 @@ class DataCleaner:
         if self.missing_value_strategy == "drop":
             return df.dropna()
         elif self.missing_value_strategy == "fill_mean":
-            for col in df.select_dtypes(include=["number"]).columns:
-                df[col].fillna(df[col].mean(), inplace=True)
-            for col in df.select_dtypes(include=["object"]).columns:
-                if not df[col].mode().empty:
-                    df[col].fillna(df[col].mode()[0], inplace=True)
-            return df
+            # All column means and modes in one pass each, applied with a single fillna
+            fill_values = df.select_dtypes(include=["number"]).mean().to_dict()
+            modes = df.select_dtypes(include=["object", "string"]).mode()
+            if not modes.empty:
+                fill_values.update(modes.iloc[0].dropna().to_dict())
+            return df.fillna(fill_values)
         elif self.missing_value_strategy == "fill_constant":
             return df.fillna(self.fill_constant)
         else:
@@ -210,13 +288,11 @@ class DataCleaner:
         Normalizes numeric and percentage formats.
         """
         for col in df.select_dtypes(include=["object", "string"]).columns:
-            series = df[col].astype(str).str.strip()
-            is_percentage = series.str.contains("%").mean() > 0.5
-
-            # Remove currency, commas, %
-            cleaned = series.str.replace(r"[\$,]", "", regex=True).str.replace("%", "", regex=True)
-            numeric_series = pd.to_numeric(cleaned, errors="coerce")
+            series = df[col].astype(self._string_dtype)
+            is_percentage = series.str.contains("%", regex=False).mean() > 0.5
 
+            # Remove whitespace, currency, commas and % in one substitution
+            numeric_series = pd.to_numeric(series.str.replace(_CURRENCY_RE, "", regex=True), errors="coerce")
             if is_percentage:
                 numeric_series = numeric_series / 100.0
 
@@ -227,15 +303,39 @@ class DataCleaner:
         """
         Standardizes categorical string values.
         """
-        for col in df.select_dtypes(include=["object"]).columns:
+        for col in df.select_dtypes(include=["object", "string"]).columns:
             df[col] = df[col].str.lower().str.strip().replace(self.synonym_map)
         return df
 
-    def parse_dates(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _normalize_and_standardize(self, df: pd.DataFrame, text_cols: List[str]) -> pd.DataFrame:
+        """
+        normalize_values and standardize_categories fused into one pass per text column: values that
+        parse as numbers become floats, the rest are lower-cased, stripped and mapped through synonym_map.
+        """
+        out = {}
+        for col in text_cols:
+            series = df[col].astype(self._string_dtype)
+            is_percentage = series.str.contains("%", regex=False).mean() > 0.5
+            numeric_series = pd.to_numeric(series.str.replace(_CURRENCY_RE, "", regex=True), errors="coerce")
+            if is_percentage:
+                numeric_series = numeric_series / 100.0
+
+            is_number = numeric_series.notna()
+            if is_number.sum() == df[col].notna().sum():
+                out[col] = numeric_series
+                continue
+            text = df[col].str.lower().str.strip().replace(self.synonym_map)
+            out[col] = text.astype(object).mask(is_number, numeric_series) if is_number.any() else text
+        return df.assign(**out) if out else df
+
+    def parse_dates(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Converts date-like strings to datetime objects.
+        :param columns: Columns to try; defaults to every object/string column.
         """
-        for col in df.select_dtypes(include=["object", "string"]).columns:
+        if columns is None:
+            columns = df.select_dtypes(include=["object", "string"]).columns
+        for col in columns:
             try:
                 parsed = pd.to_datetime(df[col], errors="coerce")
                 if parsed.notnull().sum() > 0:
@@ -292,10 +392,12 @@ class DataCleaner:
         Runs the full cleaning pipeline.
         """
         df = self.normalize_column_names(df)
+        df = self.to_string_columns(df)
         df = self.convert_data_types(df)
         df = self.handle_missing_values(df)
-        df = self.normalize_values(df)
-        df = self.standardize_categories(df)
-        df = self.parse_dates(df)
+        # The text columns are found once and shared by the fused value/category step and date parsing
+        text_cols = list(df.select_dtypes(include=["object", "string"]).columns)
+        df = self._normalize_and_standardize(df, text_cols)
+        df = self.parse_dates(df, columns=[col for col in text_cols if not pd.api.types.is_numeric_dtype(df[col])])
         return df
 
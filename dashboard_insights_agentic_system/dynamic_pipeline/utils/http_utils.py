@@ -0,0 +1,32 @@
+# http_utils.py
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def build_http_session() -> requests.Session:
+    """
+    Pooled keep-alive session with retries, so repeated calls reuse warm TCP/TLS connections.
+    Every module that fetches over HTTP builds its session here, so pool and retry policy live in one place.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=Retry(total=2, backoff_factor=0.2))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = "DashboardInsightsAgenticSystem/1.0"
+    return session
+
+
+def conditional_headers(validators) -> dict:
+    """
+    If-None-Match / If-Modified-Since headers for revalidating a cached response.
+    :param validators: (etag, last_modified, ...) as stored with the cached response, or None when nothing is cached.
+    """
+    headers = {}
+    if validators:
+        etag, last_modified = validators[0], validators[1]
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    return headers
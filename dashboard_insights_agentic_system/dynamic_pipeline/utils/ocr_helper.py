@@ -1,16 +1,66 @@
 # ocr_helper.py
+import hashlib
 import io
 import re
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Union, Dict, Any, List
 from urllib.parse import urlparse
 
+import numpy as np
 import pytesseract
 import requests
-from PIL import Image, ImageEnhance, ImageFilter, ImageOps
+from PIL import Image, ImageEnhance, ImageFilter
+
+from utils.http_utils import build_http_session
+
+try:
+    # In-process Tesseract bindings; without them every OCR call spawns a tesseract subprocess
+    import tesserocr
+except ImportError:
+    tesserocr = None
 
 logger = logging.getLogger(__name__)
 
+# Default download session shared by all OCRHelper instances, so short-lived helpers
+# still reuse pooled connections to the image hosts
+_SESSION = build_http_session()
+
+# Grey level (after autocontrast) at or above which a pixel becomes white when binarizing
+_BINARIZE_THRESHOLD = 140
+
+# Numbers as OCR'd from dashboards: optional sign, thousands separators, optional decimals
+_NUMBER_RE = re.compile(r"[-+]?\d[\d,]*\.?\d*")
+
+# Per-thread PyTessBaseAPI instances keyed by language (an API object isn't thread-safe, and
+# loading the traineddata is the expensive part, so each worker thread keeps its own)
+_tess_local = threading.local()
+
+# Structured OCR results kept per helper, keyed by a BLAKE2b digest of the image bytes
+_RESULT_CACHE_SIZE = 512
+
+
+def _parse_numbers(text: str) -> List[float]:
+    """
+    Return every number in the text as a float, with thousands separators dropped.
+    """
+    return [float(num.replace(",", "")) for num in _NUMBER_RE.findall(text)]
+
+
+def _tess_api(lang: str) -> "tesserocr.PyTessBaseAPI":
+    """
+    Return this thread's PyTessBaseAPI for a language, initializing it on first use.
+    """
+    apis = getattr(_tess_local, "apis", None)
+    if apis is None:
+        apis = _tess_local.apis = {}
+    api = apis.get(lang)
+    if api is None:
+        api = apis[lang] = tesserocr.PyTessBaseAPI(lang=lang)
+    return api
+
 
 class OCRHelper:
     """
@@ -21,11 +71,15 @@ class OCRHelper:
     def __init__(self, tesseract_cmd: Optional[str] = None, session: Optional[requests.Session] = None):
         """
         :param tesseract_cmd: Optional path to the tesseract executable (if not in PATH).
-        :param session: Optional requests.Session for URL downloads (reused for performance).
+        :param session: Optional requests.Session for URL downloads; defaults to a shared module-level session.
         """
         if tesseract_cmd:
             pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
-        self.session = session or requests.Session()
+        # An explicit executable means the caller wants that binary, so stay on pytesseract
+        self._use_tesserocr = tesserocr is not None and not tesseract_cmd
+        self.session = session or _SESSION
+        self._result_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
 
     def _preprocess_image(self, image: Image.Image, binarize: bool = True) -> Image.Image:
         """
@@ -34,13 +88,18 @@ class OCRHelper:
         # Convert to grayscale
         image = image.convert("L")
 
-        # Optional binarization (thresholding)
         if binarize:
-            image = ImageOps.autocontrast(image)
-            image = image.point(lambda x: 0 if x < 140 else 255, '1')
-
-        # Increase contrast
-        image = ImageEnhance.Contrast(image).enhance(2)
+            # Autocontrast + threshold as one comparison on the uint8 buffer: stretching lo..hi to
+            # 0..255 is monotonic, so "stretched >= threshold" is "pixel >= cutoff" in original grey
+            # levels. The result is already pure black/white, so only the non-binarized path needs
+            # the contrast boost
+            arr = np.asarray(image)
+            lo, hi = int(arr.min()), int(arr.max())
+            cutoff = lo + -(-_BINARIZE_THRESHOLD * (hi - lo) // 255) if hi > lo else _BINARIZE_THRESHOLD
+            image = Image.fromarray(np.where(arr >= cutoff, np.uint8(255), np.uint8(0)))
+        else:
+            # Increase contrast
+            image = ImageEnhance.Contrast(image).enhance(2)
 
         # Sharpen image
         image = image.filter(ImageFilter.SHARPEN)
@@ -62,47 +121,93 @@ class OCRHelper:
         else:
             raise ValueError(f"Unsupported image_input type: {type(image_input)}")
 
-    def _load_from_url(self, url: str) -> Image.Image:
+    def _download(self, url: str) -> bytes:
         """
-        Fetch an image from a URL.
+        Fetch the raw bytes of an image URL.
         """
         try:
             resp = self.session.get(url, timeout=10)
             resp.raise_for_status()
-            return Image.open(io.BytesIO(resp.content))
+            return resp.content
         except Exception as e:
             logger.exception(f"Failed to download image from URL: {url}")
             raise
 
+    def _load_from_url(self, url: str) -> Image.Image:
+        """
+        Fetch an image from a URL.
+        """
+        return Image.open(io.BytesIO(self._download(url)))
+
     def extract_text(self, image_input: Union[str, bytes, Image.Image], lang: str = "eng", binarize: bool = True) -> str:
         """
         Perform OCR and return extracted text.
         """
         image = self._load_image(image_input)
         image = self._preprocess_image(image, binarize=binarize)
+        if self._use_tesserocr:
+            api = _tess_api(lang)
+            api.SetImage(image)
+            return api.GetUTF8Text().strip()
         return pytesseract.image_to_string(image, lang=lang).strip()
 
     def extract_numbers(self, image_input: Union[str, bytes, Image.Image], lang: str = "eng", binarize: bool = True) -> List[float]:
         """
         Perform OCR and extract all numbers from the text.
         """
-        text = self.extract_text(image_input, lang=lang, binarize=binarize)
-        numbers = re.findall(r"[-+]?\d[\d,]*\.?\d*", text)
-        return [float(num.replace(",", "")) for num in numbers] if numbers else []
+        return _parse_numbers(self.extract_text(image_input, lang=lang, binarize=binarize))
 
-    def extract_structured(self, image_input: Union[str, bytes, Image.Image], lang: str = "eng", binarize: bool = True) -> Dict[str, Any]:
+    def _image_bytes(self, image_input: Union[str, bytes, Image.Image]) -> bytes:
+        """
+        Raw bytes identifying an image input, hashed for the result cache before any decoding.
+        """
+        if isinstance(image_input, bytes):
+            return image_input
+        if isinstance(image_input, Image.Image):
+            return f"{image_input.mode}{image_input.size}".encode() + image_input.tobytes()
+        if isinstance(image_input, str):
+            if urlparse(image_input).scheme in ("http", "https"):
+                return self._download(image_input)
+            with open(image_input, "rb") as f:
+                return f.read()
+        raise ValueError(f"Unsupported image_input type: {type(image_input)}")
+
+    def extract_structured(self, image_input: Union[str, bytes, Image.Image], lang: str = "eng",
+                           binarize: bool = True, use_cache: bool = True) -> Dict[str, Any]:
         """
         Perform OCR and return structured results with text and numbers.
+        With use_cache, an image seen before (same bytes and settings) returns the earlier result,
+        marked with "cache": "hit", without running Tesseract again.
         """
         try:
+            if use_cache:
+                data = self._image_bytes(image_input)
+                key = (hashlib.blake2b(data, digest_size=16).digest(), lang, binarize)
+                with self._result_cache_lock:
+                    cached = self._result_cache.get(key)
+                    if cached is not None:
+                        self._result_cache.move_to_end(key)
+                if cached is not None:
+                    text, numbers = cached
+                    return {"status": "success", "text": text, "numbers": list(numbers), "error": None, "cache": "hit"}
+                if not isinstance(image_input, Image.Image):
+                    # Decode the bytes already in hand instead of re-reading or re-downloading
+                    image_input = data
+
             text = self.extract_text(image_input, lang=lang, binarize=binarize)
-            numbers = re.findall(r"[-+]?\d[\d,]*\.?\d*", text)
-            return {
+            result = {
                 "status": "success",
                 "text": text,
-                "numbers": [float(num.replace(",", "")) for num in numbers],
+                "numbers": _parse_numbers(text),
                 "error": None
             }
+            if use_cache:
+                # Cached as immutable (text, numbers) so callers mutating their result can't alter it
+                with self._result_cache_lock:
+                    self._result_cache[key] = (text, tuple(result["numbers"]))
+                    if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                        self._result_cache.popitem(last=False)
+            return result
         except Exception as e:
             logger.exception("OCR extraction failed.")
             return {"status": "failed", "text": "", "numbers": [], "error": str(e)}
@@ -112,7 +217,26 @@ class OCRHelper:
         Shortcut for extracting OCR results directly from an image URL.
         """
         try:
-            image = self._load_from_url(url)
-            return self.extract_structured(image, lang=lang, binarize=binarize)
+            data = self._download(url)
         except Exception as e:
-            return {"status": "failed", "text": "", "numbers": [], "error": str(e)}
\ No newline at end of file
+            return {"status": "failed", "text": "", "numbers": [], "error": str(e)}
+        # Same bytes as an earlier call (e.g. another drill state of the same dashboard) hit the cache
+        return self.extract_structured(data, lang=lang, binarize=binarize)
+
+    def extract_batch(self, image_inputs: List[Union[str, bytes, Image.Image]], lang: str = "eng",
+                      binarize: bool = True, max_workers: int = 4) -> List[Dict[str, Any]]:
+        """
+        OCR several images (e.g. individual dashboard panes) concurrently and return one structured
+        result per input, in input order. Tesseract runs in a subprocess or, with tesserocr, with the
+        GIL released, so threads overlap well.
+        """
+        def run(image_input):
+            try:
+                return self.extract_structured(image_input, lang=lang, binarize=binarize)
+            except Exception as e:
+                return {"status": "failed", "text": "", "numbers": [], "error": str(e)}
+
+        if len(image_inputs) <= 1:
+            return [run(image_input) for image_input in image_inputs]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(image_inputs))) as pool:
+            return list(pool.map(run, image_inputs))
\ No newline at end of file
@@ -1,13 +1,75 @@
 import plotly.graph_objs as go
 import plotly.io as pio
-from typing import Dict, Any, Optional, List
-import matplotlib.pyplot as plt
+from typing import Dict, Any, Optional, List, Tuple
+from collections import OrderedDict
+from itertools import zip_longest
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import io
-import base64
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib module
+    import pybase64 as base64
+except ImportError:
+    import base64
 import matplotlib.patches as mpatches
-from matplotlib.table import Table
 import numpy as np
-import requests
+from PIL import Image
+
+from utils.http_utils import build_http_session, conditional_headers
+
+# Inline visual thumbnails fit a 0.25 x 0.15 axes on the 12x8in, 100dpi figure
+_VISUAL_THUMBNAIL_SIZE = (300, 120)
+_IMAGE_CACHE_SIZE = 256
+_IMAGE_FETCH_WORKERS = 8
+
+# (fontsize, color, weight) styles shared by render_dashboard's text lines
+_SECTION_STYLE = (14, 'darkblue', 'bold')
+_BODY_STYLE = (12, 'black', 'normal')
+_SMALL_STYLE = (10, 'black', 'normal')
+_GRAY_SMALL_STYLE = (10, 'gray', 'normal')
+
+# Component keys left out of the one-line component summary
+_COMPONENT_SUMMARY_SKIP_KEYS = frozenset({'highlights'})
+
+# Shared HTTP session so repeated renders reuse keep-alive connections
+_session = build_http_session()
+_image_pool = ThreadPoolExecutor(max_workers=_IMAGE_FETCH_WORKERS)
+
+# url -> (etag, last_modified, thumbnail), least recently used first
+_image_cache: "OrderedDict[str, Tuple[Optional[str], Optional[str], Image.Image]]" = OrderedDict()
+_image_cache_lock = threading.Lock()
+
+
+def _fetch_image(url: str) -> Image.Image:
+    """
+    Fetch a visual image as a decoded thumbnail.
+
+    Previously seen URLs are revalidated with If-None-Match / If-Modified-Since,
+    so unchanged images come back as a 304 and skip download and decoding.
+    """
+    with _image_cache_lock:
+        cached = _image_cache.get(url)
+    headers = conditional_headers(cached)
+
+    response = _session.get(url, headers=headers, timeout=2)
+    if cached and response.status_code == 304:
+        with _image_cache_lock:
+            if url in _image_cache:
+                _image_cache.move_to_end(url)
+        return cached[2]
+    response.raise_for_status()
+
+    img = Image.open(io.BytesIO(response.content))
+    img.thumbnail(_VISUAL_THUMBNAIL_SIZE, Image.Resampling.BILINEAR)
+
+    with _image_cache_lock:
+        _image_cache[url] = (response.headers.get("ETag"), response.headers.get("Last-Modified"), img)
+        _image_cache.move_to_end(url)
+        if len(_image_cache) > _IMAGE_CACHE_SIZE:
+            _image_cache.popitem(last=False)
+    return img
 
 
 def render_dashboard(dashboard_data: Dict[str, Any]) -> str:
@@ -21,16 +83,44 @@ def render_dashboard(dashboard_data: Dict[str, Any]) -> str:
         A base64-encoded string of the rendered dashboard image.
     """
 
-    # Set up figure
-    fig, ax = plt.subplots(figsize=(12, 8))
+    # Set up figure (Agg canvas directly, no pyplot state machine)
+    fig = Figure(figsize=(12, 8))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
     ax.axis('off')
+    # Text is laid out in fixed 0..1 coordinates; keep table backgrounds from rescaling the axes
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.set_autoscale_on(False)
     y = 1.0
     line_height = 0.05
+    # line_height expressed in points, used as the pitch of batched multiline text
+    line_pitch_pts = line_height * fig.get_figheight() * 72 * ax.get_position().height
+
+    # Consecutive lines sharing a style are queued and emitted as one Text artist
+    pending_lines: List[str] = []
+    pending_style = None
+    pending_top = y
+    pending_end = y
+
+    def flush_text():
+        if pending_lines:
+            fontsize, color, weight = pending_style
+            ax.text(0, pending_top, "\n".join(pending_lines), fontsize=fontsize, color=color, weight=weight,
+                    va='top', ha='left', wrap=True, linespacing=line_pitch_pts / fontsize)
+            pending_lines.clear()
 
     def draw_text(text, fontsize=12, color='black', weight='normal'):
-        nonlocal y
-        ax.text(0, y, text, fontsize=fontsize, color=color, weight=weight, va='top', ha='left', wrap=True)
+        nonlocal y, pending_style, pending_top, pending_end
+        style = (fontsize, color, weight)
+        # Start a new run on a style change or when a table/image moved y in between
+        if style != pending_style or y != pending_end:
+            flush_text()
+            pending_style = style
+            pending_top = y
+        pending_lines.append(text)
         y -= line_height
+        pending_end = y
 
     # Title
     draw_text(f"Dashboard Source: {dashboard_data.get('source', '')} | Auth: {dashboard_data.get('auth_type', '')}", 16, 'navy', 'bold')
@@ -45,81 +135,87 @@ def render_dashboard(dashboard_data: Dict[str, Any]) -> str:
     # KPIs
     kpis = dashboard_data.get('kpis', [])
     if kpis:
-        draw_text("KPIs:", 14, 'darkblue', 'bold')
+        draw_text("KPIs:", *_SECTION_STYLE)
         for kpi in kpis:
             if isinstance(kpi, dict):
                 kpi_str = f"{kpi.get('name', '')}: {kpi.get('value', '')}"
             else:
                 kpi_str = str(kpi)
-            draw_text(f"  {kpi_str}", 12, 'black')
+            draw_text(f"  {kpi_str}", *_BODY_STYLE)
 
     # Tables
     tables = dashboard_data.get('tables', [])
     if tables:
-        draw_text("Tables:", 14, 'darkblue', 'bold')
+        draw_text("Tables:", *_SECTION_STYLE)
         for idx, table in enumerate(tables):
             headers = table.get('headers', [])
             rows = table.get('rows', [])
             if headers and rows:
-                # Draw as matplotlib table
-                y_table = y
-                tab = Table(ax, bbox=[0, y_table-0.15, 0.8, 0.12])
-                for col, header in enumerate(headers):
-                    tab.add_cell(0, col, 0.1, 0.03, text=header, loc='center', facecolor='#cccccc')
-                for row_idx, row in enumerate(rows):
-                    for col, cell in enumerate(row):
-                        tab.add_cell(row_idx+1, col, 0.1, 0.03, text=str(cell), loc='center', facecolor='#f9f9f9')
-                ax.add_table(tab)
+                # Draw as a single row-shaded background plus one monospace text block
+                str_rows = [list(map(str, headers))] + [list(map(str, row)) for row in rows]
+                widths = [max(map(len, col)) for col in zip_longest(*str_rows, fillvalue="")]
+                table_txt = "\n".join(" | ".join(cell.ljust(w) for cell, w in zip(r, widths)) for r in str_rows)
+                n_rows = len(str_rows)
+                left, right, bottom, top = 0, 0.8, y - 0.15, y - 0.03
+                bg = np.where(np.arange(n_rows) % 2 == 1, 0.98, 0.94)[:, None]
+                bg[0] = 0.8  # header row
+                ax.imshow(bg, cmap='gray', vmin=0, vmax=1, aspect='auto',
+                          interpolation='nearest', extent=[left, right, bottom, top])
+                row_pitch_pts = (top - bottom) / n_rows * line_pitch_pts / line_height
+                ax.text(left + 0.005, top, table_txt, family='monospace', fontsize=8,
+                        va='top', ha='left', linespacing=row_pitch_pts / 8)
                 y -= 0.15
             else:
-                draw_text(f"  Table {idx+1}: {table}", 10)
+                draw_text(f"  Table {idx+1}: {table}", *_SMALL_STYLE)
 
     # Filters
     filters = dashboard_data.get('filters', [])
     if filters:
-        draw_text("Filters:", 14, 'darkblue', 'bold')
+        draw_text("Filters:", *_SECTION_STYLE)
         for f in filters:
-            draw_text(f"  {f}", 10, 'gray')
+            draw_text(f"  {f}", *_GRAY_SMALL_STYLE)
 
     # Visuals (images, SVGs)
     visuals = dashboard_data.get('visuals', [])
     if visuals:
-        draw_text("Visuals:", 14, 'darkblue', 'bold')
-        for v in visuals:
-            if isinstance(v, dict) and v.get('type') == 'image' and v.get('src'):
+        draw_text("Visuals:", *_SECTION_STYLE)
+        # Start all image downloads up front so they overlap instead of adding up
+        image_futures = [
+            _image_pool.submit(_fetch_image, v['src'])
+            if isinstance(v, dict) and v.get('type') == 'image' and v.get('src') else None
+            for v in visuals
+        ]
+        for v, future in zip(visuals, image_futures):
+            if future is not None:
                 try:
                     # Try to load and plot the image inline (if it's a URL)
-                    import requests
-                    from PIL import Image
-                    from io import BytesIO
-                    response = requests.get(v['src'], timeout=2)
-                    img = Image.open(BytesIO(response.content))
+                    img = future.result()
                     ax_img = fig.add_axes([0.7, y-0.1, 0.25, 0.15])
                     ax_img.imshow(img)
                     ax_img.axis('off')
                     y -= 0.18
                 except Exception:
-                    draw_text(f"  [Image: {v.get('alt', v.get('src', ''))}]", 10, 'gray')
+                    draw_text(f"  [Image: {v.get('alt', v.get('src', ''))}]", *_GRAY_SMALL_STYLE)
             elif isinstance(v, dict) and v.get('type') == 'svg':
-                draw_text(f"  [SVG visual]", 10, 'gray')
+                draw_text("  [SVG visual]", *_GRAY_SMALL_STYLE)
             else:
-                draw_text(f"  {v}", 10, 'gray')
+                draw_text(f"  {v}", *_GRAY_SMALL_STYLE)
 
     # Layout
     layout = dashboard_data.get('layout', {})
     if layout:
-        draw_text("Layout:", 14, 'darkblue', 'bold')
-        draw_text(f"  {layout}", 10, 'gray')
+        draw_text("Layout:", *_SECTION_STYLE)
+        draw_text(f"  {layout}", *_GRAY_SMALL_STYLE)
 
     # Components (with highlights)
     components = dashboard_data.get('components', [])
     if components:
-        draw_text("Components:", 14, 'darkblue', 'bold')
+        draw_text("Components:", *_SECTION_STYLE)
         for comp in components:
             ctype = comp.get('type', 'component')
             highlights = comp.get('highlights', [])
-            summary = f"  {ctype.title()}: " + ", ".join(f"{k}={v}" for k, v in comp.items() if k != 'highlights')
-            draw_text(summary, 10, 'black')
+            summary = f"  {ctype.title()}: " + ", ".join(f"{k}={v}" for k, v in comp.items() if k not in _COMPONENT_SUMMARY_SKIP_KEYS)
+            draw_text(summary, *_SMALL_STYLE)
             if highlights:
                 draw_text(f"    Highlights: {highlights}", 10, 'orange')
 
@@ -129,13 +225,14 @@ def render_dashboard(dashboard_data: Dict[str, Any]) -> str:
         draw_text("HTML Text (excerpt):", 12, 'darkblue', 'bold')
         draw_text(html_text[:200] + ("..." if len(html_text) > 200 else ""), 8, 'gray')
 
+    flush_text()
+
     # Save the figure to a BytesIO object
     buf = io.BytesIO()
-    plt.tight_layout()
-    plt.savefig(buf, format="png", bbox_inches='tight')
-    plt.close(fig)
-    buf.seek(0)
+    fig.tight_layout()
+    # Lossy WebP (encoded by Pillow) is several times smaller than PNG for dashboard renders
+    fig.savefig(buf, format="webp", bbox_inches='tight', pil_kwargs={"quality": 85, "method": 4})
 
     # Encode the image to base64
-    img_base64 = base64.b64encode(buf.read()).decode("utf-8")
-    return f"data:image/png;base64,{img_base64}"
\ No newline at end of file
+    img_base64 = base64.b64encode(buf.getvalue()).decode("utf-8")
+    return f"data:image/webp;base64,{img_base64}"
\ No newline at end of file
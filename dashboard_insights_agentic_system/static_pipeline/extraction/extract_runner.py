@@ -1,59 +1,33 @@
 from PIL import Image
 from typing import Dict, Any
-from dashboard_insights_agentic_system.static_pipeline.extraction.extractor import (
-    extract_text_from_kpi,
-    extract_table,
-    extract_chart_description
-)
+from dashboard_insights_agentic_system.static_pipeline.extraction.extractor import extract_all_components
+from dashboard_insights_agentic_system.static_pipeline.layout_analysis.layout_detector import merge_overlapping_components
 
 
 
 def extract_all_dashboard_components(
-    full_image: Image.Image, components: list[Dict[str, Any]]
+    full_image: Image.Image, components: list[Dict[str, Any]], merge: bool = True
 ) -> list[Dict[str, Any]]:
     """
     Extracts structured data from all detected dashboard components.
 
+    Duplicate and nested detections are merged first (see merge_overlapping_components), then all
+    remaining crops go through OCR as one batch. The result has one entry per merged component, in
+    the order of `components`, so it can be shorter than the input.
+
     Args:
         full_image (Image.Image): Full dashboard image.
         components (list[Dict[str, Any]]): List of detected components with bounding boxes.
+        merge (bool): Set to False when `components` was already passed through merge_overlapping_components.
 
     Returns:
         list[Dict[str, Any]]: List of extracted data + component metadata.
     """
-    extracted_data = []
-    
-    for component in components:
-        partial_image = full_image.crop(component['bbox'])
-        confidence = component.get('confidence')
-        
-        if component['label'] == 'kpi':
-            extracted_data.append({
-                "type": "kpi",
-                "data": extract_text_from_kpi(partial_image),
-                "bbox": component['bbox'],
-                "confidence": confidence
-            })
-        elif component['label'] == 'table':
-            extracted_data.append({
-                "type": "table",
-                "data": extract_table(partial_image),
-                "bbox": component['bbox'],
-                "confidence": confidence
-            })
-        elif component['label'] in ['chart', 'title', 'legend', 'axis']:
-            extracted_data.append({
-                "type": "chart",
-                "data": extract_chart_description(partial_image),
-                "bbox": component['bbox'],
-                "confidence": confidence
-            })
-        else:
-            extracted_data.append({
-                "type": "unknown",
-                "data": {},
-                "bbox": component['bbox'],
-                "confidence": confidence
-            })
+    if not components:
+        return []
 
-    return extracted_data
\ No newline at end of file
+    # Decode the pixels once up front; every crop then reads the same loaded buffer
+    full_image.load()
+    if merge:
+        components = merge_overlapping_components(components)
+    return extract_all_components(components, full_image)
@@ -1,20 +1,137 @@
+import numpy as np
+import paddle
 from PIL import Image
 from typing import Dict, Any, List
 from paddleocr import PaddleOCR
+import copy
+import functools
+import hashlib
+import os
 import re
-ocr = PaddleOCR(use_angle_cls=True, lang='en', show_log=False)
-def extract_text_from_kpi(cropped_image: Image.Image) -> Dict[str, Any]:
+import threading
+from collections import OrderedDict
+# The shared PaddleOCR predictor isn't thread-safe; callers on worker threads take turns on it
+_ocr_lock = threading.Lock()
+
+# Inference backend settings, overridable through the environment. MKL-DNN speeds up the CPU
+# path; on GPU, TensorRT at FP16 accelerates detection/recognition. Pages are OCR'd as one batch
+# of crops, so recognition keeps batching; set DASHBOARD_OCR_REC_BATCH=1 to trade speed for memory
+_USE_GPU = paddle.device.is_compiled_with_cuda() and paddle.device.cuda.device_count() > 0
+OCR_ENABLE_MKLDNN = os.getenv("DASHBOARD_OCR_MKLDNN", "0" if _USE_GPU else "1") == "1"
+OCR_USE_TENSORRT = os.getenv("DASHBOARD_OCR_TENSORRT", "1" if _USE_GPU else "0") == "1"
+OCR_PRECISION = os.getenv("DASHBOARD_OCR_PRECISION", "fp16" if _USE_GPU else "fp32")
+OCR_REC_BATCH_NUM = int(os.getenv("DASHBOARD_OCR_REC_BATCH", "6"))
+# Rendered dashboards are upright, so the angle classifier (a model pass per text box) is opt-in
+ANGLE_CLS_ENABLED = os.getenv("DASHBOARD_OCR_ANGLE_CLS", "0") == "1"
+# KPI crops no taller than this hold a single text line: recognition runs on them directly, no detection
+SINGLE_LINE_MAX_HEIGHT = 40
+
+
+@functools.lru_cache(maxsize=4)
+def get_ocr(lang: str = 'en', use_angle_cls: bool = ANGLE_CLS_ENABLED) -> PaddleOCR:
     """
-    Extracts KPI information (label + value).
+    Returns the PaddleOCR model for a language/angle-classifier setting, loading it on first use.
+    """
+    return PaddleOCR(
+        use_angle_cls=use_angle_cls,
+        lang=lang,
+        show_log=False,
+        use_gpu=_USE_GPU,
+        enable_mkldnn=OCR_ENABLE_MKLDNN,
+        use_tensorrt=OCR_USE_TENSORRT,
+        precision=OCR_PRECISION,
+        rec_batch_num=OCR_REC_BATCH_NUM,
+        cls_batch_num=OCR_REC_BATCH_NUM
+    )
+
+# (page content hash, label, bbox) -> parsed component data, most recently used last
+_COMPONENT_CACHE_SIZE = 1024
+_component_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_component_cache_lock = threading.Lock()
+
+# Numeric or percentage KPI values
+_KPI_VALUE_RE = re.compile(r'[\d,.%KMB]+')
+# Chart text categories in priority order with their keywords. A line goes to the first category
+# any of its words belongs to, wherever the word sits in the line ("x axis"/"x-axis" are matched
+# as the word pair x + axis)
+_CHART_CATEGORIES = (
+    ("title", ("title", "chart", "overview", "summary")),
+    ("x_axis", ("xaxis", "horizontal", "month", "date", "time", "category", "period")),
+    ("y_axis", ("yaxis", "vertical", "value", "amount", "score", "count", "number", "total")),
+    ("legend", ("legend", "series", "group", "class", "type", "category")),
+)
+# keyword -> priority of its first (winning) category
+_CHART_KEYWORDS = {
+    keyword: rank
+    for rank, (_, keywords) in reversed(list(enumerate(_CHART_CATEGORIES)))
+    for keyword in keywords
+}
+_WORD_RE = re.compile(r'\w+')
+
+
+def _chart_text_category(text: str):
+    """
+    Returns the chart category of an OCR line (see _CHART_CATEGORIES), or None for other text.
+    """
+    words = _WORD_RE.findall(text.lower())
+    ranks = [_CHART_KEYWORDS[word] for word in words if word in _CHART_KEYWORDS]
+    # "x axis" / "x-axis" tokenize as two words
+    ranks.extend(_CHART_KEYWORDS[first + second] for first, second in zip(words, words[1:])
+                 if second == "axis" and first in ("x", "y"))
+    return _CHART_CATEGORIES[min(ranks)][0] if ranks else None
+
+
+def _bgr_array(image: Image.Image) -> np.ndarray:
+    """
+    Converts a PIL image to the BGR uint8 array layout PaddleOCR expects for ndarray input.
+    """
+    # convert() copies even when the mode already matches, so only call it when needed
+    rgb = image if image.mode == 'RGB' else image.convert('RGB')
+    return np.ascontiguousarray(np.asarray(rgb)[:, :, ::-1])
+
+
+def _crop_view(arr: np.ndarray, bbox) -> np.ndarray:
     """
-    kpi_text = ocr.predict(cropped_image, cls=True)
-    extracted_texts = [line[1][0] for line in kpi_text[0]] if kpi_text else []
+    Returns the bbox region of an image array as a view (no pixel copy), rounded like PIL's crop
+    and clipped to the image.
+    """
+    x1, y1, x2, y2 = (max(0, int(round(v))) for v in bbox)
+    return arr[y1:y2, x1:x2]
+
+
+def _run_ocr(cropped_images: List[np.ndarray], det: bool = True) -> List[list]:
+    """
+    Runs the shared OCR model over a batch of crops in one call, serialized across threads.
+    Returns the OCR'd lines of each crop, in order (empty when nothing was read).
+    With det=False each crop is recognized as one text line, without text detection.
+    Raises RuntimeError if the model doesn't return exactly one result per crop.
+    """
+    if not cropped_images:
+        return []
+    with _ocr_lock:
+        results = get_ocr().predict(cropped_images, det=det, cls=ANGLE_CLS_ENABLED)
+    results = list(results or [])
+    if len(results) != len(cropped_images):
+        raise RuntimeError(
+            f"OCR returned {len(results)} results for {len(cropped_images)} crops (det={det})"
+        )
+    if not det:
+        # Recognition-only results are (text, score) per crop; shape them like detected lines
+        return [[[None, line] for line in (lines or [])] for lines in results]
+    return [lines or [] for lines in results]
+
+
+def parse_kpi(lines: list) -> Dict[str, Any]:
+    """
+    Parses KPI information (label + value) from OCR'd lines.
+    """
+    extracted_texts = [line[1][0] for line in lines]
 
     if not extracted_texts:
         return {"label": None, "value": None}
 
     # Look for numeric or percentage values
-    value = next((t for t in extracted_texts if re.search(r'[\d,.%KMB]+', t)), None)
+    value = next((t for t in extracted_texts if _KPI_VALUE_RE.search(t)), None)
     label_candidates = [t for t in extracted_texts if t != value]
 
     return {
@@ -22,12 +139,12 @@ def extract_text_from_kpi(cropped_image: Image.Image) -> Dict[str, Any]:
         "value": value
     }
 
-def extract_table(cropped_image: Image.Image) -> Dict[str, Any]:
+
+def parse_table(lines: list) -> Dict[str, Any]:
     """
-    Extracts structured data from table images.
+    Parses structured table data from OCR'd lines.
     """
-    tabular_data = ocr.predict(cropped_image, cls=True)
-    rows = [[line[1][0] for line in row_group] for row_group in tabular_data[0]] if tabular_data else []
+    rows = [[line[1][0] for line in row_group] for row_group in lines]
 
     if not rows:
         return {"table": []}
@@ -43,17 +160,16 @@ def extract_table(cropped_image: Image.Image) -> Dict[str, Any]:
     return {"table": structured_table}
 
 
-def extract_chart_description(cropped_image: Image.Image) -> Dict[str, Any]:
+def parse_chart_description(lines: list) -> Dict[str, Any]:
     """
-    Extracts chart metadata like title, axis labels, legend entries.
+    Parses chart metadata like title, axis labels, legend entries from OCR'd lines.
 
     Args:
-        cropped_image (Image.Image): Cropped image of the chart.
+        lines (list): OCR'd lines of the chart crop.
 
     Returns:
         Dict[str, Any]: Metadata like {"title": "Sales Over Time", "x_axis": "Month", ...}
     """
-    chart_text = ocr.predict(cropped_image, cls=True)
     chart_data = {
         "title": None,
         "x_axis": None,
@@ -61,30 +177,23 @@ def extract_chart_description(cropped_image: Image.Image) -> Dict[str, Any]:
         "legend": [],
         "other_text": []
     }
-    title_candidates = []
-    x_axis_candidates = []
-    y_axis_candidates = []
+    # Title / x-axis / y-axis / legend keyword matches; anything else is other_text
+    candidates = {"title": [], "x_axis": [], "y_axis": [], "legend": chart_data["legend"]}
+    title_candidates = candidates["title"]
+    x_axis_candidates = candidates["x_axis"]
+    y_axis_candidates = candidates["y_axis"]
 
-    if chart_text:
-        for line in chart_text[0]:
+    if lines:
+        for line in lines:
             text = line[1][0].strip()
-            # Title detection: look for common title patterns or position (first line)
-            if re.search(r'\b(title|chart|overview|summary)\b', text, re.IGNORECASE):
-                title_candidates.append(text)
-            # X-axis detection: look for axis keywords or common axis names
-            elif re.search(r'\b(x[- ]?axis|horizontal|month|date|time|category|period)\b', text, re.IGNORECASE):
-                x_axis_candidates.append(text)
-            # Y-axis detection: look for axis keywords or common axis names
-            elif re.search(r'\b(y[- ]?axis|vertical|value|amount|score|count|number|total)\b', text, re.IGNORECASE):
-                y_axis_candidates.append(text)
-            # Legend: look for legend keywords or typical legend entries
-            elif re.search(r'\b(legend|series|group|class|type|category)\b', text, re.IGNORECASE):
-                chart_data["legend"].append(text)
+            category = _chart_text_category(text)
+            if category:
+                candidates[category].append(text)
             else:
                 chart_data["other_text"].append(text)
 
         # Assign best candidates
-        chart_data["title"] = title_candidates[0] if title_candidates else (chart_text[0][0][1][0] if chart_text[0] else None)
+        chart_data["title"] = title_candidates[0] if title_candidates else lines[0][1][0]
         chart_data["x_axis"] = x_axis_candidates[0] if x_axis_candidates else None
         chart_data["y_axis"] = y_axis_candidates[0] if y_axis_candidates else None
 
@@ -95,6 +204,93 @@ def extract_chart_description(cropped_image: Image.Image) -> Dict[str, Any]:
 
     return chart_data
 
+
+# Component labels whose crops are OCR'd, mapped to their extraction type and parser
+_DISPATCH = {
+    "kpi": ("kpi", parse_kpi),
+    "table": ("table", parse_table),
+    **{label: ("chart", parse_chart_description) for label in ("chart", "title", "legend", "axis")}
+}
+
+
+def extract_text_from_kpi(cropped_image: Image.Image) -> Dict[str, Any]:
+    """
+    Extracts KPI information (label + value).
+    """
+    return parse_kpi(_run_ocr([_bgr_array(cropped_image)])[0])
+
+
+def extract_table(cropped_image: Image.Image) -> Dict[str, Any]:
+    """
+    Extracts structured data from table images.
+    """
+    return parse_table(_run_ocr([_bgr_array(cropped_image)])[0])
+
+
+def extract_chart_description(cropped_image: Image.Image) -> Dict[str, Any]:
+    """
+    Extracts chart metadata like title, axis labels, legend entries.
+
+    Args:
+        cropped_image (Image.Image): Cropped image of the chart.
+
+    Returns:
+        Dict[str, Any]: Metadata like {"title": "Sales Over Time", "x_axis": "Month", ...}
+    """
+    return parse_chart_description(_run_ocr([_bgr_array(cropped_image)])[0])
+
+
+def extract_all_components(components: List[Dict], full_image: Image.Image) -> List[Dict[str, Any]]:
+    """
+    Extracts data for every component of one page with a single batched OCR call.
+
+    Args:
+        components (List[Dict]): Each contains label, bbox, confidence.
+        full_image (Image.Image): Original cleaned dashboard image.
+
+    Returns:
+        List[Dict[str, Any]]: Extracted data + component metadata, in component order.
+    """
+    # Crop only components whose label gets OCR'd; unknown labels need no model pass. The page is
+    # converted to an array once and each crop is a view into it rather than a pixel copy
+    ocr_indices = [i for i, c in enumerate(components) if c['label'] in _DISPATCH]
+    arr = _bgr_array(full_image) if ocr_indices else None
+
+    # Components of a page seen before (same pixels, label and box) reuse their parsed data
+    page_hash = hashlib.blake2b(arr.tobytes(), digest_size=16).digest() if ocr_indices else None
+    keys = {i: (page_hash, arr.shape, components[i]['label'], tuple(components[i]['bbox'])) for i in ocr_indices}
+    cached = {}
+    with _component_cache_lock:
+        for i in ocr_indices:
+            if keys[i] in _component_cache:
+                _component_cache.move_to_end(keys[i])
+                cached[i] = copy.deepcopy(_component_cache[keys[i]])
+    ocr_indices = [i for i in ocr_indices if i not in cached]
+    crops = {i: _crop_view(arr, components[i]['bbox']) for i in ocr_indices}
+    # Single-line KPI crops skip text detection; everything else gets the full det+rec pass
+    is_single_line = {i: components[i]['label'] == 'kpi' and crops[i].shape[0] <= SINGLE_LINE_MAX_HEIGHT for i in ocr_indices}
+    rec_only = [i for i in ocr_indices if is_single_line[i]]
+    full = [i for i in ocr_indices if not is_single_line[i]]
+    lines_by_index = dict(zip(full, _run_ocr([crops[i] for i in full])))
+    lines_by_index.update(zip(rec_only, _run_ocr([crops[i] for i in rec_only], det=False)))
+
+    extracted = []
+    for i, component in enumerate(components):
+        comp_type, parser = _DISPATCH.get(component['label'], ("unknown", None))
+        if i in cached:
+            data = cached[i]
+        elif parser is not None:
+            data = parser(lines_by_index[i])
+            with _component_cache_lock:
+                _component_cache[keys[i]] = copy.deepcopy(data)
+                if len(_component_cache) > _COMPONENT_CACHE_SIZE:
+                    _component_cache.popitem(last=False)
+        else:
+            data = {}
+        extracted.append({"type": comp_type, "data": data, "bbox": component['bbox'], "confidence": component.get('confidence')})
+    return extracted
+
+
 def extract_component_data(component: Dict, full_image: Image.Image) -> Dict[str, Any]:
     """
     Dispatches extraction based on component type.
@@ -106,13 +302,4 @@ def extract_component_data(component: Dict, full_image: Image.Image) -> Dict[str
     Returns:
         Dict[str, Any]: Extracted data + component metadata.
     """
-    partial_image = full_image.crop(component['bbox'])
-    confidence = component.get('confidence')
-    if component['label'] == 'kpi':
-        return {"type": "kpi", "data": extract_text_from_kpi(partial_image), "bbox": component['bbox'], "confidence": confidence}
-    elif component['label'] == 'table':
-        return {"type": "table", "data": extract_table(partial_image), "bbox": component['bbox'], "confidence": confidence}
-    elif component['label'] in ['chart', 'title', 'legend', 'axis']:
-        return {"type": "chart", "data": extract_chart_description(partial_image), "bbox": component['bbox'], "confidence": confidence}
-    else:
-        return {"type": "unknown", "data": {}, "bbox": component['bbox'], "confidence": confidence}
\ No newline at end of file
+    return extract_all_components([component], full_image)[0]
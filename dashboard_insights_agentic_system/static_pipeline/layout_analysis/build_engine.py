@@ -0,0 +1,34 @@
+"""
+Offline export of the layout detection model to a TensorRT engine.
+
+The engine is written next to the checkpoint (component_detection_model.engine), where
+load_detection_model picks it up in preference to the .pt file. Engines are specific to the
+GPU model and TensorRT version they were built with, so rebuild on each deployment target.
+
+Usage:
+    python -m dashboard_insights_agentic_system.static_pipeline.layout_analysis.build_engine [model.pt]
+"""
+import sys
+
+from ultralytics import YOLO
+
+from dashboard_insights_agentic_system.static_pipeline.layout_analysis.component_classifier import DEFAULT_MODEL_PATH
+
+
+def build_engine(model_path: str = DEFAULT_MODEL_PATH, half: bool = True, workspace: int = 4) -> str:
+    """
+    Exports a YOLO checkpoint to a TensorRT engine.
+
+    Args:
+        model_path (str): Path to the trained .pt model.
+        half (bool): Build an FP16 engine.
+        workspace (int): TensorRT builder workspace size in GiB.
+
+    Returns:
+        str: Path of the exported engine.
+    """
+    return YOLO(model_path).export(format="engine", half=half, workspace=workspace)
+
+
+if __name__ == "__main__":
+    print(build_engine(*sys.argv[1:2]))
@@ -1,10 +1,19 @@
+import numpy as np
 from PIL import Image, ImageDraw
 from typing import List, Dict
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
 def draw_layout_boxes(image: Image.Image, detections: List[Dict], save_path: str = None) -> Image.Image:
     """
     Draws bounding boxes around detected components.
 
+    With OpenCV available (RGB images), all boxes are drawn with one polylines call on a pixel
+    array; otherwise each box is drawn with PIL.
+
     Args:
         image (Image.Image): Original image.
         detections (List[Dict]): Detection results.
@@ -13,16 +22,27 @@ def draw_layout_boxes(image: Image.Image, detections: List[Dict], save_path: str
     Returns:
         Image.Image: Image with boxes drawn.
     """
-    image_draw = image.copy()
-    draw = ImageDraw.Draw(image_draw)
+    if cv2 is not None and image.mode == 'RGB':
+        arr = np.array(image)  # writable copy
+        if detections:
+            boxes = np.array([item["bbox"] for item in detections], dtype=np.float64).round().astype(np.int32)
+            # Each box as a closed 4-point polygon: (x1,y1) (x2,y1) (x2,y2) (x1,y2)
+            corners = boxes[:, [0, 1, 2, 1, 2, 3, 0, 3]].reshape(-1, 4, 2)
+            cv2.polylines(arr, list(corners), True, (255, 0, 0), 2)
+            for (x1, y1, _, _), item in zip(boxes.tolist(), detections):
+                cv2.putText(arr, item["label"], (x1, y1 - 4), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 1)
+        image_draw = Image.fromarray(arr)
+    else:
+        image_draw = image.copy()
+        draw = ImageDraw.Draw(image_draw)
 
-    for item in detections:
-        box = item["bbox"]
-        label = item["label"]
-        draw.rectangle(box, outline="red", width=2)
-        draw.text((box[0], box[1] - 10), label, fill="red")
+        for item in detections:
+            box = item["bbox"]
+            label = item["label"]
+            draw.rectangle(box, outline="red", width=2)
+            draw.text((box[0], box[1] - 10), label, fill="red")
 
     if save_path:
         image_draw.save(save_path)
 
-    return image_draw
\ No newline at end of file
+    return image_draw
@@ -1,10 +1,26 @@
 
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
 from PIL import Image
 from typing import List, Dict
 from .component_classifier import load_detection_model, detect_components
 from .layout_detector import parse_layout
 from .detection_visualization import draw_layout_boxes
 
+# (image content hash, model path) -> (detections, layout), most recently used last
+_LAYOUT_CACHE_SIZE = 64
+_layout_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_layout_cache_lock = threading.Lock()
+
+
+def image_digest(image: Image.Image) -> bytes:
+    """
+    Content hash of an image's pixels (with mode and size), used as a cache key.
+    """
+    return hashlib.blake2b(f"{image.mode}{image.size}".encode() + image.tobytes(), digest_size=16).digest()
+
 def layout_processing_pipeline(image: Image.Image, model_path: str = None, save_path: str = None) -> Dict[str, List[Dict]]:
     """
     Processes the dashboard image to detect and classify layout components.
@@ -17,9 +33,23 @@ def layout_processing_pipeline(image: Image.Image, model_path: str = None, save_
     Returns:
         Dict[str, List[Dict]]: Structured layout components.
     """
-    model = load_detection_model(model_path)
-    detections = detect_components(image, model)
-    layout = parse_layout(detections)
+    # A re-submitted dashboard (same pixels, same model) reuses the earlier detections and skips YOLO
+    key = (image_digest(image), model_path)
+    with _layout_cache_lock:
+        cached = _layout_cache.get(key)
+        if cached is not None:
+            _layout_cache.move_to_end(key)
+    if cached is not None:
+        detections, layout = copy.deepcopy(cached)
+    else:
+        model = load_detection_model(model_path)
+        detections = detect_components(image, model)
+        layout = parse_layout(detections)
+        if model is not None:
+            with _layout_cache_lock:
+                _layout_cache[key] = copy.deepcopy((detections, layout))
+                if len(_layout_cache) > _LAYOUT_CACHE_SIZE:
+                    _layout_cache.popitem(last=False)
     
     if save_path:
         annotated_image = draw_layout_boxes(image, detections, save_path)
@@ -1,5 +1,13 @@
+from collections import defaultdict
 from typing import List, Dict
 
+import numpy as np
+
+# Labels whose OCR pass already covers any text component nested inside them
+CONTAINER_LABELS = ("chart", "table")
+# Text-only labels dropped when nested in a container; KPI tiles and tables keep their own parse
+NESTED_TEXT_LABELS = ("title", "legend", "axis", "text")
+
 def parse_layout(detections: List[Dict]) -> Dict[str, List[Dict]]:
     """
     Parses raw detection output into structured layout components.
@@ -16,11 +24,61 @@ def parse_layout(detections: List[Dict]) -> Dict[str, List[Dict]]:
             "titles": [{"bbox": [...], "confidence": 0.95}]
         }
     """
-    parsed = {}
+    parsed = defaultdict(list)
     for item in detections:
-        label = item['label']
-        parsed.setdefault(label + 's', []).append({
+        parsed[item['label']].append({
             "bbox": item["bbox"],
             "confidence": item.get("confidence", 1.0)
         })
-    return parsed
\ No newline at end of file
+    # Pluralize once per distinct label rather than once per detection
+    return {label + 's': items for label, items in parsed.items()}
+
+
+def merge_overlapping_components(
+    detections: List[Dict], iou_threshold: float = 0.7, containment_threshold: float = 0.95
+) -> List[Dict]:
+    """
+    Drops redundant detections before OCR so overlapping pixels are read once:
+    same-label boxes overlapping another with IoU above iou_threshold (greedy NMS, higher confidence
+    wins), and title/legend/axis/text boxes lying (by containment_threshold of their area) inside a
+    kept chart/table box. KPI and table boxes are never dropped for being nested.
+
+    Args:
+        detections (List[Dict]): Raw detections with label, bbox, confidence.
+        iou_threshold (float): Same-label IoU above which the lower-confidence box is dropped.
+        containment_threshold (float): Share of a box's area inside a container to count as nested.
+
+    Returns:
+        List[Dict]: The kept detections, in their original order; may be shorter than the input.
+    """
+    if len(detections) < 2:
+        return list(detections)
+
+    boxes = np.array([item["bbox"] for item in detections], dtype=np.float64)
+    scores = np.array([item.get("confidence") or 0.0 for item in detections])
+    labels = np.array([item["label"] for item in detections])
+
+    # Pairwise intersection areas, IoU, and the share of box j that lies inside box i
+    x1, y1, x2, y2 = boxes.T
+    areas = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    inter_w = np.clip(np.minimum(x2[:, None], x2[None, :]) - np.maximum(x1[:, None], x1[None, :]), 0, None)
+    inter_h = np.clip(np.minimum(y2[:, None], y2[None, :]) - np.maximum(y1[:, None], y1[None, :]), 0, None)
+    inter = inter_w * inter_h
+    with np.errstate(divide="ignore", invalid="ignore"):
+        iou = np.nan_to_num(inter / (areas[:, None] + areas[None, :] - inter))
+        inside = np.nan_to_num(inter / areas[None, :])
+    np.fill_diagonal(inside, 0)
+
+    keep = np.ones(len(detections), dtype=bool)
+    same_label = labels[:, None] == labels[None, :]
+    order = np.argsort(-scores, kind="stable")
+    for pos, i in enumerate(order):
+        if keep[i]:
+            later = order[pos + 1:]
+            keep[later[same_label[i, later] & (iou[i, later] > iou_threshold)]] = False
+
+    is_container = np.isin(labels, CONTAINER_LABELS)
+    nested = (inside[is_container & keep] > containment_threshold).any(axis=0)
+    keep &= ~(nested & np.isin(labels, NESTED_TEXT_LABELS))
+
+    return [item for item, kept in zip(detections, keep) if kept]
@@ -0,0 +1,92 @@
+import queue
+import threading
+from typing import Any, Dict, List, Optional
+
+from dashboard_insights_agentic_system.static_pipeline.preprocessing.preprocessing_runner import preprocess_input
+from dashboard_insights_agentic_system.static_pipeline.layout_analysis.component_classifier import (
+    load_detection_model,
+    detect_components
+)
+from dashboard_insights_agentic_system.static_pipeline.layout_analysis.layout_detector import (
+    parse_layout,
+    merge_overlapping_components
+)
+from dashboard_insights_agentic_system.static_pipeline.extraction.extract_runner import extract_all_dashboard_components
+
+# Marks the end of the input stream on a stage queue
+_DONE = object()
+
+
+class PipelineRunner:
+    """
+    Runs the static pipeline (preprocess -> layout detection -> OCR extraction) over many dashboards
+    with one thread per stage, so rasterizing/cleaning the next file overlaps with model inference
+    on the current ones. Bounded queues between stages provide backpressure.
+    """
+
+    def __init__(self, model_path: Optional[str] = None, queue_size: int = 4):
+        """
+        :param model_path: Optional path to a trained detection model.
+        :param queue_size: Max pages buffered between two stages.
+        """
+        self.model_path = model_path
+        self.queue_size = queue_size
+
+    def run(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+        """
+        Processes every file and returns one result per input, in input order:
+        {"status", "file_path", "layout", "components", "error"}.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(file_paths)
+        load_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        layout_q: queue.Queue = queue.Queue(maxsize=self.queue_size)
+
+        def fail(idx: int, error: Exception) -> None:
+            results[idx] = {"status": "failed", "file_path": file_paths[idx], "layout": {}, "components": [], "error": str(error)}
+
+        def loader() -> None:
+            for idx, path in enumerate(file_paths):
+                try:
+                    load_q.put((idx, preprocess_input(path)))
+                except Exception as e:
+                    fail(idx, e)
+            load_q.put(_DONE)
+
+        def layout() -> None:
+            # load_detection_model logs its own failure and returns None
+            model = load_detection_model(self.model_path)
+            load_error = RuntimeError(f"Could not load detection model from {self.model_path or 'the default path'}")
+            # Keep draining the loader even if the model failed, so neither neighbour stage blocks
+            while (item := load_q.get()) is not _DONE:
+                idx, image = item
+                if model is None:
+                    fail(idx, load_error)
+                    continue
+                try:
+                    layout_q.put((idx, image, detect_components(image, model)))
+                except Exception as e:
+                    fail(idx, e)
+            layout_q.put(_DONE)
+
+        def extract() -> None:
+            while (item := layout_q.get()) is not _DONE:
+                idx, image, detections = item
+                try:
+                    # Layout and components both describe the merged detections
+                    detections = merge_overlapping_components(detections)
+                    results[idx] = {
+                        "status": "success",
+                        "file_path": file_paths[idx],
+                        "layout": parse_layout(detections),
+                        "components": extract_all_dashboard_components(image, detections, merge=False),
+                        "error": None
+                    }
+                except Exception as e:
+                    fail(idx, e)
+
+        threads = [threading.Thread(target=stage, daemon=True) for stage in (loader, layout, extract)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
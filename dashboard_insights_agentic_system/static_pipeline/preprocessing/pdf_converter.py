@@ -1,5 +1,24 @@
+import os
+from typing import List, Optional
+
+from PIL import Image
 from pdf2image import convert_from_path
 
+
+def convert_pdf_to_images(pdf_path: str, thread_count: Optional[int] = None) -> List[Image.Image]:
+    """
+    Converts every page of a PDF into a PIL Image, with poppler rendering pages in parallel.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+        thread_count (int): Rendering threads; defaults to the CPU count.
+
+    Returns:
+        List[Image.Image]: One image per page, in page order.
+    """
+    return convert_from_path(pdf_path, thread_count=thread_count or os.cpu_count() or 1)
+
+
 def convert_pdf_to_image(pdf_path: str):
     """
     Converts a single-page PDF into a PIL Image.
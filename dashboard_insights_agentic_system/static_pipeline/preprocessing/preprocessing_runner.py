@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
 from PIL import Image
 
 def preprocess_input(file_path: str) -> Image.Image:
@@ -26,4 +29,31 @@ def preprocess_input(file_path: str) -> Image.Image:
     from dashboard_insights_agentic_system.static_pipeline.preprocessing.image_cleaner import clean_image
     cleaned_image = clean_image(image)
 
-    return cleaned_image
\ No newline at end of file
+    return cleaned_image
+
+
+def preprocess_pages(file_path: str, max_workers: int = 4) -> List[Image.Image]:
+    """
+    Multi-page variant of preprocess_input: every page of a PDF (or the single image file) is
+    returned cleaned, in page order. Pages are rendered in parallel by poppler and cleaned on a
+    thread pool (PIL releases the GIL inside its resize/filter kernels).
+
+    Args:
+        file_path (str): Path to the input file (PDF or image).
+        max_workers (int): Threads used for page cleanup.
+
+    Returns:
+        List[Image.Image]: Preprocessed page images.
+    """
+    from dashboard_insights_agentic_system.static_pipeline.preprocessing.image_cleaner import clean_image
+
+    if file_path.lower().endswith(".pdf"):
+        from dashboard_insights_agentic_system.static_pipeline.preprocessing.pdf_converter import convert_pdf_to_images
+        images = convert_pdf_to_images(file_path)
+    else:
+        images = [Image.open(file_path)]
+
+    if len(images) == 1:
+        return [clean_image(images[0])]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(images))) as pool:
+        return list(pool.map(clean_image, images))
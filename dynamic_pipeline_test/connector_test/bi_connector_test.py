@@ -0,0 +1,19 @@
+import pytest
+from dashboard_insights_agentic_system.dynamic_pipeline.connectors.bi_connector import detect_bi_source_from_url
+
+def test_detect_powerbi_from_domain_and_path():
+    assert detect_bi_source_from_url("https://app.powerbi.com/groups/me/reports/abc") == "powerbi"
+    assert detect_bi_source_from_url("https://bi.example.com/PowerBI/sales") == "powerbi"
+
+def test_detect_tableau_from_domain_and_path():
+    assert detect_bi_source_from_url("https://public.tableau.com/app/profile/x") == "tableau"
+    assert detect_bi_source_from_url("https://bi.example.com/views/Sales/Overview") == "tableau"
+
+def test_powerbi_patterns_take_precedence():
+    assert detect_bi_source_from_url("https://bi.example.com/views/x/reports/y") == "powerbi"
+
+def test_detect_unknown_or_missing_url_raises():
+    with pytest.raises(ValueError):
+        detect_bi_source_from_url("https://example.com/dashboard")
+    with pytest.raises(ValueError):
+        detect_bi_source_from_url("")
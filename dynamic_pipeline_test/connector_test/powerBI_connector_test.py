@@ -0,0 +1,30 @@
+import pytest
+import dashboard_insights_agentic_system.dynamic_pipeline.connectors.powerbi_connector as powerbi_connector
+
+
+class DummySession:
+    def __init__(self):
+        self.headers = {}
+
+
+def test_connect_private_powerbi_builds_authorized_session(monkeypatch):
+    session = DummySession()
+    monkeypatch.setattr(powerbi_connector, 'build_http_session', lambda: session)
+    monkeypatch.setattr(
+        powerbi_connector, 'get_access_token_client_credentials',
+        lambda tenant_id, client_id, client_secret: {'access_token': 'tok', 'expires_in': 3600, 'token_type': 'Bearer'}
+    )
+    result = powerbi_connector.connect_private_powerbi('https://api.powerbi.com', 'tenant', 'client', 'secret', workspace_id='ws')
+    assert result['status'] == 'success'
+    assert result['session'] is session
+    assert session.headers['Authorization'] == 'Bearer tok'
+    assert result['workspace_id'] == 'ws'
+
+
+def test_connect_private_powerbi_token_failure(monkeypatch):
+    monkeypatch.setattr(
+        powerbi_connector, 'get_access_token_client_credentials',
+        lambda tenant_id, client_id, client_secret: {'error': {'error': 'invalid_client'}}
+    )
+    result = powerbi_connector.connect_private_powerbi('https://api.powerbi.com', 'tenant', 'client', 'secret')
+    assert result['status'] == 'failed'
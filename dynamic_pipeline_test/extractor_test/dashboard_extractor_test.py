@@ -40,11 +40,16 @@ def test_ensure_unified_schema_adds_highlights(extractor):
     assert unified['status'] == 'success'
     assert unified['source'] == 'powerbi'
     assert unified['auth_type'] == 'private'
-    assert unified['components'][0]['highlights'] == []
+    assert unified['components'][0]['highlights'] == ()
     assert unified['drill_state'] == {'foo': 'bar'}
     assert unified['html_text'] == 'text'
     assert unified['error'] is None
 
+def test_ensure_unified_schema_adds_highlights_to_component_dict(extractor):
+    input_result = {'components': {'sales': {'type': 'kpi', 'value': 1}}}
+    unified = extractor._ensure_unified_schema(input_result, 'powerbi', 'public')
+    assert unified['components']['sales']['highlights'] == ()
+
 def test_extract_dashboard_fail(monkeypatch, extractor):
     def fail_connect_bi_dashboard(*args, **kwargs):
         return {'status': 'failed', 'error': 'connect error'}
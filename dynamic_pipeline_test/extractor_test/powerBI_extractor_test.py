@@ -0,0 +1,26 @@
+import pytest
+from dashboard_insights_agentic_system.dynamic_pipeline.extractors.PowerBI_extractor import PowerBIExtractor
+
+class DummyOCR:
+    def __init__(self):
+        pass
+
+@pytest.fixture
+def extractor():
+    return PowerBIExtractor(ocr_helper=DummyOCR())
+
+TABLE_PAGE = """
+<html><body><table>
+  <tr><th>Region</th><th>Sales</th><th>Code</th><th>Margin</th></tr>
+  <tr><td>West</td><td>1,234</td><td>007</td><td>12.50</td></tr>
+  <tr><td>East</td><td>N/A</td><td>010</td><td></td></tr>
+</table></body></html>
+"""
+
+def test_public_dashboard_keeps_literal_cell_text(extractor):
+    result = extractor.extract_public_dashboard('https://app.powerbi.com/view?r=x', use_ocr=False, html_content=TABLE_PAGE)
+    assert result['status'] == 'success'
+    table = result['tables']['table_1']
+    assert table['headers'] == ['Region', 'Sales', 'Code', 'Margin']
+    assert table['rows'] == [['West', '1,234', '007', '12.50'], ['East', 'N/A', '010', '']]
+    assert result['components']['table_1']['rows'] is table['rows']
@@ -0,0 +1,45 @@
+import pytest
+from dashboard_insights_agentic_system.dynamic_pipeline.extractors.tableau_extractor import TableauExtractor
+
+class DummyOCR:
+    def __init__(self):
+        pass
+
+@pytest.fixture
+def extractor():
+    return TableauExtractor(ocr_helper=DummyOCR())
+
+NESTED_PAGE = """
+<html><body>
+  <div id="root">
+    <div id="sales">Sales 1,234</div>
+    <div id="profit">Profit 56</div>
+    <div>x</div>
+    <div><span>Region: West</span></div>
+  </div>
+</body></html>
+"""
+
+def test_public_dashboard_keeps_nested_widgets(extractor):
+    result = extractor.extract_public_dashboard('https://public.tableau.com/views/x', use_ocr=False, html_content=NESTED_PAGE)
+    assert result['status'] == 'success'
+    widgets = [c for c in result['components'] if 'type' not in c]
+    # root, sales, profit and the anonymous "Region" div; the anonymous "x" div is too short to keep
+    assert len(widgets) == 4
+    assert [w['id'] for w in widgets] == ['root', 'sales', 'profit', None]
+    assert widgets[0]['text'] == 'Sales 1,234Profit 56xRegion: West'
+    assert widgets[3]['text'] == 'Region: West'
+    assert len(result['layout']['sections']) == 5
+
+class FailingViews:
+    def get_by_id(self, view_id):
+        raise RuntimeError('view not found')
+
+class FailingServer:
+    views = FailingViews()
+
+def test_private_dashboard_failure_keeps_data_iter(extractor):
+    result = extractor.extract_private_dashboard(FailingServer(), 'missing')
+    assert result['status'] == 'failed'
+    assert list(result['data_iter']) == []
+    assert result['error'] == 'view not found'
@@ -2,6 +2,8 @@ import pytest
 import types
 import sys
 
+import pandas as pd
+
 # Import the data_cleaning module
 import dashboard_insights_agentic_system.dynamic_pipeline.utils.data_cleaning as data_cleaning
 
@@ -42,4 +44,21 @@ def test_clean_dashboard_handles_missing_fields():
     assert isinstance(cleaned, dict)
     # Should not raise error even if fields are missing
 
+def test_clean_kpis_matches_per_item_clean():
+    kpis = [{'name': f'k{i}', 'value': str(i)} for i in range(9)]
+    kpis += [
+        {'name': 'k9', 'value': 'N/A'},
+        {'name': 'margin', 'value': '12%'},
+        {'name': 'units', 'value': '1200'},
+        {'name': '2024-01-01', 'value': '5'},
+        {'name': 'missing', 'value': None},
+    ]
+    cleaner = data_cleaning.DataCleaner()
+    cleaned = cleaner.clean_unified_dashboard_data({'kpis': [dict(k) for k in kpis]})
+    expected = [cleaner.clean(pd.DataFrame([k])) for k in kpis]
+    assert [df.to_dict(orient='records') for df in cleaned['kpis']] == [df.to_dict(orient='records') for df in expected]
+    assert cleaned['kpis'][9].to_dict(orient='records') == [{'name': 'k9', 'value': 'not_applicable'}]
+    assert cleaned['kpis'][10].to_dict(orient='records') == [{'name': 'margin', 'value': 0.12}]
+    assert cleaned['kpis'][13].empty
+
 # Add more tests as needed for edge cases
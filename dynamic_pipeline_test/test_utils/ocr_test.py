@@ -44,3 +44,16 @@ def test_extract_from_image_error(monkeypatch):
     result = ocr.extract_from_image("bad_img")
     assert result["status"] == "failed"
     assert result["error"] == "bad img"
+
+def test_extract_batch_keeps_input_order():
+    class EchoOCR(ocr_helper.OCRHelper):
+        def _load_image(self, image_input):
+            return image_input
+        def extract_structured(self, image, lang="eng", binarize=True):
+            if image == "bad":
+                raise ValueError("unreadable")
+            return {"status": "success", "text": image, "numbers": [], "error": None}
+    results = EchoOCR().extract_batch(["a", "bad", "c"])
+    assert [r["status"] for r in results] == ["success", "failed", "success"]
+    assert results[0]["text"] == "a" and results[2]["text"] == "c"
+    assert results[1]["error"] == "unreadable"
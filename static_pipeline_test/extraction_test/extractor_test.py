@@ -0,0 +1,53 @@
+import pytest
+from PIL import Image
+
+import dashboard_insights_agentic_system.static_pipeline.extraction.extractor as extractor
+
+
+class StubOCR:
+    """
+    Stands in for PaddleOCR: detected crops read as one chart title line, recognition-only crops
+    as one KPI value. drop_one returns one result fewer than there are crops.
+    """
+    def __init__(self, drop_one=False):
+        self.drop_one = drop_one
+        self.calls = []
+
+    def predict(self, images, det=True, cls=False):
+        self.calls.append((len(images), det))
+        if det:
+            results = [[[[[0, 0], [1, 0], [1, 1], [0, 1]], ("Sales Over Time", 0.9)]] for _ in images]
+        else:
+            results = [[("1,234", 0.95)] for _ in images]
+        return results[:-1] if self.drop_one else results
+
+
+@pytest.fixture
+def page():
+    extractor._component_cache.clear()
+    return Image.new('RGB', (200, 120), 'white')
+
+
+COMPONENTS = [
+    {'label': 'kpi', 'bbox': [0, 0, 80, 30], 'confidence': 0.9},
+    {'label': 'chart', 'bbox': [0, 40, 200, 120], 'confidence': 0.8},
+]
+
+
+def test_extract_all_components_uses_both_ocr_paths(monkeypatch, page):
+    stub = StubOCR()
+    monkeypatch.setattr(extractor, 'get_ocr', lambda: stub)
+    results = extractor.extract_all_components(COMPONENTS, page)
+    assert sorted(stub.calls) == [(1, False), (1, True)]
+    assert results[0]['type'] == 'kpi'
+    assert results[0]['data']['value'] == '1,234'
+    assert results[1]['type'] == 'chart'
+    assert results[1]['data']['title'] == 'Sales Over Time'
+
+
+@pytest.mark.parametrize('det', [True, False])
+def test_run_ocr_rejects_result_count_mismatch(monkeypatch, page, det):
+    monkeypatch.setattr(extractor, 'get_ocr', lambda: StubOCR(drop_one=True))
+    crops = [extractor._bgr_array(page), extractor._bgr_array(page)]
+    with pytest.raises(RuntimeError, match='1 results for 2 crops'):
+        extractor._run_ocr(crops, det=det)
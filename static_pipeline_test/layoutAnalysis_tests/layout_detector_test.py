@@ -0,0 +1,20 @@
+from dashboard_insights_agentic_system.static_pipeline.layout_analysis.layout_detector import merge_overlapping_components
+
+
+def test_merge_keeps_kpi_and_table_inside_chart():
+    detections = [
+        {'label': 'chart', 'bbox': [0, 0, 100, 100], 'confidence': 0.9},
+        {'label': 'kpi', 'bbox': [10, 10, 30, 20], 'confidence': 0.8},
+        {'label': 'table', 'bbox': [40, 40, 90, 90], 'confidence': 0.8},
+        {'label': 'legend', 'bbox': [60, 5, 95, 15], 'confidence': 0.7},
+    ]
+    merged = merge_overlapping_components(detections)
+    assert [d['label'] for d in merged] == ['chart', 'kpi', 'table']
+
+
+def test_merge_drops_lower_confidence_duplicate():
+    detections = [
+        {'label': 'kpi', 'bbox': [0, 0, 50, 20], 'confidence': 0.6},
+        {'label': 'kpi', 'bbox': [1, 0, 50, 20], 'confidence': 0.9},
+    ]
+    assert merge_overlapping_components(detections) == [detections[1]]